@@ -1,17 +1,44 @@
-from flask import Flask, request, jsonify, send_from_directory, render_template, redirect, url_for, flash
+from flask import Flask, Response, request, jsonify, send_file, render_template, redirect, url_for, flash, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
-from flask_migrate import Migrate
-from gtts import gTTS
 import os
 import re
+import hashlib
+import random
+import unicodedata
+import struct
+import json
+import functools
+import contextlib
+import math
+import fcntl
+import csv
+import multiprocessing
+import zipfile
+import mmap
+import concurrent.futures
+import sqlite3
+import collections
+import gzip
+import ipaddress
+import gc
+import atexit
+import queue
+import pickle
+import subprocess
+import sys
+import tempfile
+from types import SimpleNamespace
 import soundfile as sf
 import numpy as np
 from io import BytesIO
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import logging
+import threading
+import click
+import time
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,10 +53,62 @@ app.secret_key = os.getenv('SECRET_KEY')  # Load from environment variable
 # Database configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URI', 'sqlite:///app.db')  # Fallback to SQLite if DATABASE_URI is not set
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+# Engine profile, picked from the database URI unless DATABASE_PROFILE names one ('sqlite', 'postgresql' or 'off').
+# SQLite: WAL so readers never block the writer, synchronous=NORMAL (durable at checkpoints, safe with WAL)
+# and a busy timeout so concurrent writers wait for the lock instead of failing with "database is locked".
+# PostgreSQL: a sized pool, pre-ping to survive dropped connections, and a server-side statement timeout.
+DATABASE_PROFILE = os.getenv('DATABASE_PROFILE', 'auto')
+SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '5000'))
+DB_CONNECT_TIMEOUT = int(os.getenv('DB_CONNECT_TIMEOUT', '5'))
+
+def database_profile(uri):
+    if DATABASE_PROFILE != 'auto':
+        return DATABASE_PROFILE
+    scheme = uri.split(':', 1)[0].split('+', 1)[0]
+    return 'postgresql' if scheme in ('postgres', 'postgresql') else scheme
+
+if database_profile(app.config['SQLALCHEMY_DATABASE_URI']) == 'sqlite':
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {"connect_args": {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}}
+elif database_profile(app.config['SQLALCHEMY_DATABASE_URI']) == 'postgresql':
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "connect_args": {
+            "connect_timeout": DB_CONNECT_TIMEOUT,
+            "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+        },
+    }
+
 db = SQLAlchemy(app)
 
-# Initialize Flask-Migrate
-migrate = Migrate(app, db)
+# Function to apply the SQLite pragmas to every new connection; they are per connection, except journal_mode
+@db.event.listens_for(db.Engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, sqlite3.Connection) or database_profile(app.config['SQLALCHEMY_DATABASE_URI']) != 'sqlite':
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+# Initialize Flask-Migrate only for the flask CLI (`flask db ...`); a click context is active
+# while the CLI imports the app, and never under gunicorn, which has no use for Alembic
+migrate = None
+if click.get_current_context(silent=True) is not None:
+    from flask_migrate import Migrate
+    migrate = Migrate(app, db)
 
 # Flask-Login setup
 login_manager = LoginManager(app)
@@ -48,9 +127,89 @@ class User(UserMixin, db.Model):
     def check_password(self, password):
         return check_password_hash(self.password, password)
 
+# Identity of a logged-in user as the request handlers see it: id, username and is_admin,
+# detached from any database session so it can be reused across requests
+class CachedUser(UserMixin):
+    def __init__(self, id, username, is_admin):
+        self.id = id
+        self.username = username
+        self.is_admin = is_admin
+
+# Per-process LRU cache of user identities with a TTL, so authenticated requests skip the user lookup.
+# Logout and changes to a User made through the ORM invalidate it in this process; the TTL bounds
+# how long another worker can keep serving a stale entry (e.g. after is_admin is revoked).
+USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', '1024'))
+USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', '30'))
+
+class UserCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()  # user id -> (expiry, CachedUser), least recently used first
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.entries.move_to_end(user_id)
+                    self.hits += 1
+                    return entry[1]
+                del self.entries[user_id]
+                self.expired += 1
+            self.misses += 1
+            return None
+
+    def put(self, user):
+        cached = CachedUser(user.id, user.username, bool(user.is_admin))
+        with self.lock:
+            self.entries[user.id] = (time.monotonic() + self.ttl, cached)
+            self.entries.move_to_end(user.id)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return cached
+
+    def invalidate(self, user_id):
+        with self.lock:
+            if self.entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+user_cache = UserCache(USER_CACHE_SIZE, USER_CACHE_TTL)
+
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, user):
+    user_cache.invalidate(user.id)
+
 @login_manager.user_loader
 def load_user(user_id):
-    return db.session.get(User, int(user_id))  # Use db.session.get() instead of User.query.get()
+    user_id = int(user_id)
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    user = db.session.get(User, user_id)  # Use db.session.get() instead of User.query.get()
+    return user_cache.put(user) if user is not None else None
 
 # Activity Log model
 class ActivityLog(db.Model):
@@ -61,1583 +220,1722 @@ class ActivityLog(db.Model):
     action = db.Column(db.String(100), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
-# Function to log user activity
-def log_activity(user_id, username, ip_address, action):
-    log = ActivityLog(
-        user_id=user_id,
-        username=username,
-        ip_address=ip_address,
-        action=action
-    )
-    db.session.add(log)
-    db.session.commit()
+# Daily per-user, per-action counts of activity log rows removed by the retention job
+class ActivityDailyRollup(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    username = db.Column(db.String(20), nullable=False)
+    action = db.Column(db.String(100), nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    __table_args__ = (db.UniqueConstraint('day', 'user_id', 'action'),)
+
+# How often each normalized /pronounce input has been asked for, used to warm the output cache after a deploy.
+# Rows are keyed by the digest of (text, speed) so the unique index stays small whatever the text length.
+class PhraseFrequency(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    digest = db.Column(db.String(64), unique=True, nullable=False)
+    text = db.Column(db.Text, nullable=False)
+    speed = db.Column(db.Float, nullable=False, default=1.0)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    last_requested = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+# Activity log rows are queued in memory and written by a background thread in batches, so requests
+# never wait on the database. A batch is written once it is full or the oldest row has waited long enough.
+ACTIVITY_LOG_QUEUE_SIZE = int(os.getenv('ACTIVITY_LOG_QUEUE_SIZE', '10000'))
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv('ACTIVITY_LOG_BATCH_SIZE', '200'))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(os.getenv('ACTIVITY_LOG_FLUSH_INTERVAL', '1.0'))
+
+class ActivityLogWriter:
+    def __init__(self, maxsize, batch_size, flush_interval):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.thread = None
+        self.pid = None  # The thread is started lazily in each process, since threads do not survive a fork
+        self.start_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.written_inline = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.last_flush_ms = None
+
+    def _ensure_started(self):
+        if self.pid == os.getpid():
+            return
+        with self.start_lock:
+            if self.pid == os.getpid():
+                return
+            # Anything inherited from the parent's queue is the parent's to write
+            self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self.stopping = threading.Event()
+            self.thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+            self.thread.start()
+            self.pid = os.getpid()
+            atexit.register(self.close)
+
+    # Queue a row. When the queue is full, rows that may be dropped are counted and discarded;
+    # the others are written inline, so backpressure slows the request instead of losing the row.
+    def submit(self, row, droppable=False):
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            if droppable:
+                self.dropped += 1
+                if self.dropped % 1000 == 1:
+                    logger.warning(f"Activity log queue full, {self.dropped} rows dropped so far")
+                return
+            self._write([row])
+            self.written_inline += 1
+            return
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def _run(self):
+        while not self.stopping.is_set() or not self.queue.empty():
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.stopping.is_set():
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # While stopping, take whatever is left without waiting
+            while self.stopping.is_set() and len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch):
+        start = time.perf_counter()
+        try:
+            self._write(batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} activity log rows: {e}")
+        self.last_flush_ms = (time.perf_counter() - start) * 1000
+
+    # Function to insert rows in one statement and commit, in a session of its own
+    @staticmethod
+    def _write(rows):
+        with app.app_context():
+            try:
+                db.session.execute(ActivityLog.__table__.insert(), rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+    # Function to write out everything still queued; called at exit and from gunicorn's worker_exit hook
+    def close(self, timeout=10.0):
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            logger.warning(f"Activity log writer did not finish; {self.queue.qsize()} rows not written")
+
+    def stats(self):
+        return {
+            "running": self.pid == os.getpid() and self.thread is not None and self.thread.is_alive(),
+            "queued": self.queue.qsize(),
+            "max_queued": self.max_depth,
+            "queue_size": self.queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "written_inline": self.written_inline,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+activity_log_writer = ActivityLogWriter(ACTIVITY_LOG_QUEUE_SIZE, ACTIVITY_LOG_BATCH_SIZE, ACTIVITY_LOG_FLUSH_INTERVAL)
+
+# Function to log user activity. The timestamp is taken now, not when the row reaches the database.
+# Routine events pass droppable=True, so a backed-up queue sheds them instead of slowing requests.
+def log_activity(user_id, username, ip_address, action, droppable=False):
+    activity_log_writer.submit({
+        "user_id": user_id,
+        "username": username,
+        "ip_address": ip_address,
+        "action": action,
+        "timestamp": datetime.utcnow(),
+    }, droppable=droppable)
+
+# Phrase counts are kept in memory per process and added to PhraseFrequency every PHRASE_FLUSH_INTERVAL
+# seconds by a background thread, so recording a request costs a dictionary update. Texts longer than
+# PHRASE_MAX_LENGTH are not recorded: they rarely repeat and would only bloat the table.
+PHRASE_FLUSH_INTERVAL = float(os.getenv('PHRASE_FLUSH_INTERVAL', '60'))
+PHRASE_MAX_LENGTH = int(os.getenv('PHRASE_MAX_LENGTH', '200'))
+PHRASE_MAX_PENDING = int(os.getenv('PHRASE_MAX_PENDING', '10000'))
+
+def phrase_digest(text, speed):
+    return hashlib.sha256(f"{text}\0{speed!r}".encode('utf-8')).hexdigest()
+
+class PhraseRecorder:
+    def __init__(self, flush_interval, max_pending):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.pending = {}  # digest -> [text, speed, count, last requested]
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pid = None  # Started lazily in each process, like the activity log writer
+        self.stopping = threading.Event()
+        self.recorded = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pending = {}
+            self.stopping = threading.Event()
+            self.thread = threading.Thread(target=self._run, name='phrase-recorder', daemon=True)
+            self.thread.start()
+            self.pid = os.getpid()
+            atexit.register(self.close)
+
+    def record(self, text, speed):
+        if not text or len(text) > PHRASE_MAX_LENGTH:
+            return
+        self._ensure_started()
+        digest = phrase_digest(text, speed)
+        with self.lock:
+            entry = self.pending.get(digest)
+            if entry is None:
+                if len(self.pending) >= self.max_pending:
+                    self.dropped += 1
+                    return
+                entry = self.pending[digest] = [text, speed, 0, None]
+            entry[2] += 1
+            entry[3] = datetime.utcnow()
+            self.recorded += 1
+
+    def _run(self):
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    # Function to add the pending counts to the table. Two workers may insert the same new phrase at once;
+    # the loser's unique-constraint error is retried, by which time the row exists and is updated instead.
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if not pending:
+            return
+        with app.app_context():
+            for attempt in range(2):
+                try:
+                    existing = {row.digest: row for row in PhraseFrequency.query.filter(PhraseFrequency.digest.in_(pending))}
+                    for digest, (text, speed, count, last_requested) in pending.items():
+                        row = existing.get(digest)
+                        if row is None:
+                            db.session.add(PhraseFrequency(digest=digest, text=text, speed=speed, count=count, last_requested=last_requested))
+                        else:
+                            row.count += count
+                            row.last_requested = max(row.last_requested or last_requested, last_requested)
+                    db.session.commit()
+                    self.flushed += len(pending)
+                    return
+                except Exception as e:
+                    db.session.rollback()
+                    if attempt:
+                        self.failed += len(pending)
+                        logger.error(f"Failed to record {len(pending)} phrase counts: {e}")
+
+    def close(self, timeout=10.0):
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join(timeout)
+
+    def stats(self):
+        return {
+            "pending": len(self.pending),
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+phrase_recorder = PhraseRecorder(PHRASE_FLUSH_INTERVAL, PHRASE_MAX_PENDING)
 
 # Directory for audio files
-AUDIO_DIR = os.path.join(os.path.dirname(__file__), 'audio_files')  # Update this path to your audio files directory
+AUDIO_DIR = os.getenv('AUDIO_DIR', os.path.join(os.path.dirname(__file__), 'audio_files'))  # Update this path to your audio files directory
 if not os.path.exists(AUDIO_DIR):
     os.makedirs(AUDIO_DIR)
     logger.info(f"Created audio directory: {AUDIO_DIR}")
 
-# Mapping of words/phonemes to corresponding audio files
-valid_word_file_map = {
-     "a": "A.wav", "à": "A.wav",  
-    "á": "Á.wav", "ã": "Ã.wav", 
-
-    "e": "E.wav", "è": "E.wav",  
-    "é": "É.wav", "ẽ": "Ẽ.wav",  
-
-    "ɛ": "Ɛ.wav", "ɛ̀": "Ɛ.wav",  
-    "ɛ́": "Ɛ́.wav", "ɛ̃": "Ɛ̃.wav",  
-
-    "i": "I.wav", "ì": "I.wav",  
-    "í": "Í.wav", "ĩ": "Ĩ.wav",  
-    
-    "o": "O.wav", "ò": "O.wav",  
-    "ó": "Ó.wav", "õ": "Õ.wav",  
-    
-    "ɔ": "Ɔ.wav", "ɔ̀": "Ɔ.wav",  
-    "ɔ́": "Ɔ́.wav", "ɔ̃": "Ɔ̃.wav", 
-    
-    "u": "U.wav", "ù": "U.wav", 
-    "ú": "Ú.wav", "ũ": "Ũ.wav",  
-
-    "b": "B.wav", 
-    "d": "D.wav", 
-    "f": "F.wav", 
-    "g": "G.wav", 
-    "h": "H.wav", 
-    "j": "J.wav", 
-    "k": "K.wav", 
-    "l": "L.wav", 
-    "m": "M.wav", 
-    "n": "N.wav", 
-    "p": "P.wav", 
-    "s": "S.wav", 
-    "t": "T.wav", 
-    "v": "V.wav", 
-    "w": "W.wav", 
-    "y": "Y.wav", 
-    "z": "Z.wav",
-
-    "ba": "BA.wav", "bà": "BA.wav", "bá": "BÁ.wav", "bã": "BÃ.wav", 
-    "be": "BE.wav", "bè": "BE.wav", "bé": "BÉ.wav", "bẽ": "BẼ.wav",
-    "bɛ": "Bɛ.wav", "bɛ̀": "Bɛ.wav", "bɛ́": "Bɛ́.wav", "bɛ̃": "Bɛ̃.wav", "bƐ̃": "BƐ̃.wav",
-    "bi": "BI.wav", "bì": "BI.wav", "bí": "BÍ.wav", "bĩ": "BĨ.wav",
-    "bo": "BO.wav", "bò": "BO.wav", "bó": "BÓ.wav", "bõ": "BÕ.wav",
-    "bɔ": "Bɔ.wav", "bɔ̀": "Bɔ.wav", "bɔ́": "Bɔ́.wav", "bɔ̃": "Bɔ̃.wav",
-    "bu": "BU.wav", "bù": "BU.wav", "bú": "BÚ.wav", "bũ": "BŨ.wav",
-
-    "da": "DA.wav", "dà": "DA.wav", "dá": "DÁ.wav", "dã": "DÃ.wav", 
-    "de": "DE.wav", "dè": "DE.wav", "dé": "DÉ.wav", "dẽ": "DẼ.wav",
-    "dɛ": "Dɛ.wav", "dɛ̀": "Dɛ.wav", "dɛ́": "Dɛ́.wav", "dɛ̃": "Dɛ̃.wav", "dƐ̃": "DƐ̃.wav",
-    "di": "DI.wav", "dì": "DI.wav", "dí": "DÍ.wav", "dĩ": "DĨ.wav",
-    "do": "DO.wav", "dò": "DO.wav", "dó": "DÓ.wav", "dõ": "DÕ.wav",
-    "dɔ": "Dɔ.wav", "dɔ̀": "Dɔ.wav", "dɔ́": "Dɔ́.wav", "dɔ̃": "Dɔ̃.wav",
-    "du": "DU.wav", "dù": "DU.wav", "dú": "DÚ.wav", "dũ": "DŨ.wav",
-
-    "fa": "FA.wav", "fà": "FA.wav", "fá": "FÁ.wav", "fã": "FÃ.wav",
-    "fe": "FE.wav", "fè": "FE.wav", "fé": "FÉ.wav", "fẽ": "FẼ.wav",
-    "fɛ": "Fɛ.wav", "fɛ̀": "Fɛ.wav", "fɛ́": "Fɛ́.wav", "fɛ̃": "Fɛ̃.wav", "fƐ̃": "FƐ̃.wav",
-    "fi": "FI.wav", "fì": "FI.wav", "fí": "FÍ.wav", "fĩ": "FĨ.wav",
-    "fo": "FO.wav", "fò": "FO.wav", "fó": "FÓ.wav", "fõ": "FÕ.wav",
-    "fɔ": "Fɔ.wav", "fɔ̀": "Fɔ.wav", "fɔ́": "Fɔ́.wav", "fɔ̃": "Fɔ̃.wav",
-    "fu": "FU.wav", "fù": "FU.wav", "fú": "FÚ.wav", "fũ": "FŨ.wav",
-
-    "ga": "GA.wav", "gà": "GA.wav", "gá": "GÁ.wav", "gã": "GÃ.wav",
-    "ge": "GE.wav", "gè": "GE.wav", "gé": "GÉ.wav", "gẽ": "GẼ.wav",
-    "gɛ": "Gɛ.wav", "gɛ̀": "Gɛ.wav", "gɛ́": "Gɛ́.wav", "gɛ̃": "Gɛ̃.wav", "gƐ̃": "GƐ̃.wav",
-    "gi": "GI.wav", "gì": "GI.wav", "gí": "GÍ.wav", "gĩ": "GĨ.wav",
-    "go": "GO.wav", "gò": "GO.wav", "gó": "GÓ.wav", "gõ": "GÕ.wav",
-    "gɔ": "Gɔ.wav", "gɔ̀": "Gɔ.wav", "gɔ́": "Gɔ́.wav", "gɔ̃": "Gɔ̃.wav",
-    "gu": "GU.wav", "gù": "GU.wav", "gú": "GÚ.wav", "gũ": "GŨ.wav",
-    
-    "ha": "HA.wav", "hà": "HA.wav", "há": "HÁ.wav", "hã": "HÃ.wav", 
-    "he": "HE.wav", "hè": "HE.wav", "hé": "HÉ.wav", "hẽ": "HẼ.wav",
-    "hɛ": "Hɛ.wav", "hɛ̀": "Hɛ.wav", "hɛ́": "Hɛ́.wav", "hɛ̃": "Hɛ̃.wav", "hƐ̃": "HƐ̃.wav",
-    "hi": "HI.wav", "hì": "HI.wav", "hí": "HÍ.wav", "hĩ": "HĨ.wav",
-    "ho": "HO.wav", "hò": "HO.wav", "hó": "HÓ.wav", "hõ": "HÕ.wav",
-    "hɔ": "Hɔ.wav", "hɔ̀": "Hɔ.wav", "hɔ́": "Hɔ́.wav", "hɔ̃": "Hɔ̃.wav",
-    "hu": "HU.wav", "hù": "HU.wav", "hú": "HÚ.wav", "hũ": "HŨ.wav",
-    
-    "ja": "JA.wav", "jà": "JA.wav", "já": "JÁ.wav", "jã": "JÃ.wav", 
-    "je": "JE.wav", "jè": "JE.wav", "jé": "JÉ.wav", "jẽ": "JẼ.wav",
-    "jɛ": "Jɛ.wav", "jɛ̀": "Jɛ.wav", "jɛ́": "Jɛ́.wav", "jɛ̃": "Jɛ̃.wav", "jƐ̃": "JƐ̃.wav",
-    "ji": "JI.wav", "jì": "JI.wav", "jí": "JÍ.wav", "jĩ": "JĨ.wav",
-    "jo": "JO.wav", "jò": "JO.wav", "jó": "JÓ.wav", "jõ": "JÕ.wav",
-    "jɔ": "Jɔ.wav", "jɔ̀": "Jɔ.wav", "jɔ́": "Jɔ́.wav", "jɔ̃": "Jɔ̃.wav",
-    "ju": "JU.wav", "jù": "JU.wav", "jú": "JÚ.wav", "jũ": "JŨ.wav",
-
-    "ka": "KA.wav", "kà": "KA.wav", "ká": "KÁ.wav", "kã": "KÃ.wav", 
-    "ke": "KE.wav", "kè": "KE.wav", "ké": "KÉ.wav", "kẽ": "KẼ.wav",
-    "kɛ": "Kɛ.wav", "kɛ̀": "Kɛ.wav", "kɛ́": "Kɛ́.wav", "kɛ̃": "Kɛ̃.wav", "kƐ̃": "KƐ̃.wav",
-    "ki": "KI.wav", "kì": "KI.wav", "kí": "KÍ.wav", "kĩ": "KĨ.wav",
-    "ko": "KO.wav", "kò": "KO.wav", "kó": "KÓ.wav", "kõ": "KÕ.wav",
-    "kɔ": "Kɔ.wav", "kɔ̀": "Kɔ.wav", "kɔ́": "Kɔ́.wav", "kɔ̃": "Kɔ̃.wav",
-    "ku": "KU.wav", "kù": "KU.wav", "kú": "KÚ.wav", "kũ": "KŨ.wav",
-
-    "la": "LA.wav", "là": "LA.wav", "lá": "LÁ.wav", "lã": "LÃ.wav", 
-    "le": "LE.wav", "lè": "LE.wav", "lé": "LÉ.wav", "lẽ": "LẼ.wav",
-    "lɛ": "Lɛ.wav", "lɛ̀": "Lɛ.wav", "lɛ́": "Lɛ́.wav", "lɛ̃": "Lɛ̃.wav", "lƐ̃": "LƐ̃.wav",
-    "li": "LI.wav", "lì": "LI.wav", "lí": "LÍ.wav", "lĩ": "LĨ.wav",
-    "lo": "LO.wav", "lò": "LO.wav", "ló": "LÓ.wav", "lõ": "LÕ.wav",
-    "lɔ": "Lɔ.wav", "lɔ̀": "Lɔ.wav", "lɔ́": "Lɔ́.wav", "lɔ̃": "Lɔ̃.wav",
-    "lu": "LU.wav", "lù": "LU.wav", "lú": "LÚ.wav", "lũ": "LŨ.wav",
-
-    "ma": "MA.wav", "mà": "MA.wav", "má": "MÁ.wav", "mã": "MÃ.wav", 
-    "me": "ME.wav", "mè": "ME.wav", "mé": "MÉ.wav", "mẽ": "MẼ.wav",
-    "mɛ": "Mɛ.wav", "mɛ̀": "Mɛ.wav", "mɛ́": "Mɛ́.wav", "mɛ̃": "Mɛ̃.wav", "mƐ̃": "MƐ̃.wav",
-    "mi": "MI.wav", "mì": "MI.wav", "mí": "MÍ.wav", "mĩ": "MĨ.wav",
-    "mo": "MO.wav", "mò": "MO.wav", "mó": "MÓ.wav", "mõ": "MÕ.wav",
-    "mɔ": "Mɔ.wav", "mɔ̀": "Mɔ.wav", "mɔ́": "Mɔ́.wav", "mɔ̃": "Mɔ̃.wav",
-    "mu": "MU.wav", "mù": "MU.wav", "mú": "MÚ.wav", "mũ": "MŨ.wav",
-
-    "na": "NA.wav", "nà": "NA.wav", "ná": "NÁ.wav", "nã": "NÃ.wav", 
-    "ne": "NE.wav", "nè": "NE.wav", "né": "NÉ.wav", "nẽ": "NẼ.wav",
-    "nɛ": "NƐ.wav", "nɛ̀": "NƐ.wav", "nɛ́": "NƐ́.wav", "nɛ̃": "NƐ̃.wav", "nɛ̃": "NƐ̃.wav",
-    "ni": "NI.wav", "nì": "NI.wav", "ní": "NÍ.wav", "nĩ": "NĨ.wav",
-    "no": "NO.wav", "nò": "NO.wav", "nó": "NÓ.wav", "nõ": "NÕ.wav",
-    "nɔ": "Nɔ.wav", "nɔ̀": "Nɔ.wav", "nɔ́": "Nɔ́.wav", "nɔ̃": "Nɔ̃.wav",
-    "nu": "NU.wav", "nù": "NU.wav", "nú": "NÚ.wav", "nũ": "NŨ.wav",
-
-    "pa": "PA.wav", "pà": "PA.wav", "pá": "PÁ.wav", "pã": "PÃ.wav", 
-    "pe": "PE.wav", "pè": "PE.wav", "pé": "PÉ.wav", "pẽ": "PẼ.wav",
-    "pɛ": "Pɛ.wav", "pɛ̀": "Pɛ.wav", "pɛ́": "Pɛ́.wav", "pɛ̃": "Pɛ̃.wav", "pƐ̃": "PƐ̃.wav",
-    "pi": "PI.wav", "pì": "PI.wav", "pí": "PÍ.wav", "pĩ": "PĨ.wav",
-    "po": "PO.wav", "pò": "PO.wav", "pó": "PÓ.wav", "põ": "PÕ.wav",
-    "pɔ": "Pɔ.wav", "pɔ̀": "Pɔ.wav", "pɔ́": "Pɔ́.wav", "pɔ̃": "Pɔ̃.wav",
-    "pu": "PU.wav", "pù": "PU.wav", "pú": "PÚ.wav", "pũ": "PŨ.wav",
-
-    "sa": "SA.wav", "sà": "SA.wav", "sá": "SÁ.wav", "sã": "SÃ.wav", 
-    "se": "SE.wav", "sè": "SE.wav", "sé": "SÉ.wav", "sẽ": "SẼ.wav",
-    "sɛ": "Sɛ.wav", "sɛ̀": "Sɛ.wav", "sɛ́": "Sɛ́.wav", "sɛ̃": "Sɛ̃.wav", "sƐ̃": "SƐ̃.wav",
-    "si": "SI.wav", "sì": "SI.wav", "sí": "SÍ.wav", "sĩ": "SĨ.wav",
-    "so": "SO.wav", "sò": "SO.wav", "só": "SÓ.wav", "sõ": "SÕ.wav",
-    "sɔ": "Sɔ.wav", "sɔ̀": "Sɔ.wav", "sɔ́": "Sɔ́.wav", "sɔ̃": "Sɔ̃.wav",
-    "su": "SU.wav", "sù": "SU.wav", "sú": "SU.wav", "sũ": "SŨ.wav",
-
-    "ta": "TA.wav", "tà": "TA.wav", "tá": "TÁ.wav", "tã": "TÃ.wav", 
-    "te": "TE.wav", "tè": "TE.wav", "té": "TÉ.wav", "tẽ": "TẼ.wav",
-    "tɛ": "Tɛ.wav", "tɛ̀": "Tɛ.wav", "tɛ́": "Tɛ́.wav", "tɛ̃": "Tɛ̃.wav", "tƐ̃": "TƐ̃.wav",
-    "ti": "TI.wav", "tì": "TI.wav", "tí": "TÍ.wav", "tĩ": "TĨ.wav",
-    "to": "TO.wav", "tò": "TO.wav", "tó": "TÓ.wav", "tõ": "TÕ.wav",
-    "tɔ": "Tɔ.wav", "tɔ̀": "Tɔ.wav", "tɔ́": "Tɔ́.wav", "tɔ̃": "Tɔ̃.wav",
-    "tu": "TU.wav", "tù": "TU.wav", "tú": "TU.wav", "tũ": "TŨ.wav",
-
-    "va": "VA.wav", "và": "VA.wav", "vá": "VÁ.wav", "vã": "VÃ.wav", 
-    "ve": "VE.wav", "vè": "VE.wav", "vé": "VÉ.wav", "vẽ": "VẼ.wav",
-    "vɛ": "Vɛ.wav", "vɛ̀": "Vɛ.wav", "vɛ́": "Vɛ́.wav", "vɛ̃": "Vɛ̃.wav", "vƐ̃": "VƐ̃.wav",
-    "vi": "VI.wav", "vì": "VI.wav", "ví": "VÍ.wav", "vĩ": "VĨ.wav",
-    "vo": "VO.wav", "vò": "VO.wav", "vó": "VÓ.wav", "võ": "VÕ.wav",
-    "vɔ": "Vɔ.wav", "vɔ̀": "Vɔ.wav", "vɔ́": "Vɔ́.wav", "vɔ̃": "Vɔ̃.wav",
-    "vu": "VU.wav", "vù": "VU.wav", "vú": "VU.wav", "vũ": "VŨ.wav",
-
-    "wa": "WA.wav", "wà": "WA.wav", "wá": "WÁ.wav", "wã": "WÃ.wav", 
-    "we": "WE.wav", "wè": "WE.wav", "wé": "WÉ.wav", "wẽ": "WẼ.wav",
-    "wɛ": "Wɛ.wav", "wɛ̀": "Wɛ.wav", "wɛ́": "Wɛ́.wav", "wɛ̃": "Wɛ̃.wav", "wɛ̃": "WƐ̃.wav",
-    "wi": "WI.wav", "wì": "WI.wav", "wí": "WÍ.wav", "wĩ": "WĨ.wav",
-    "wo": "WO.wav", "wò": "WO.wav", "wó": "WÓ.wav", "wõ": "WÕ.wav",
-    "wɔ": "Wɔ.wav", "wɔ̀": "Wɔ.wav", "wɔ́": "Wɔ́.wav", "wɔ̃": "Wɔ̃.wav",
-    "wu": "WU.wav", "wù": "WU.wav", "wú": "WU.wav", "wũ": "WŨ.wav",
-
-    "ya": "YA.wav", "yà": "YA.wav", "yá": "YÁ.wav", "yã": "YÃ.wav", 
-    "ye": "YE.wav", "yè": "YE.wav", "yé": "YÉ.wav", "yẽ": "YẼ.wav",
-    "yɛ": "Yɛ.wav", "yɛ̀": "Yɛ.wav", "yɛ́": "Yɛ́.wav", "yɛ̃": "Yɛ̃.wav", "yƐ̃": "YƐ̃.wav",
-    "yi": "YI.wav", "yì": "YI.wav", "yí": "YÍ.wav", "yĩ": "YĨ.wav",
-    "yo": "YO.wav", "yò": "YO.wav", "yó": "YÓ.wav", "yõ": "YÕ.wav",
-    "yɔ": "Yɔ.wav", "yɔ̀": "Yɔ.wav", "yɔ́": "Yɔ́.wav", "yɔ̃": "Yɔ̃.wav",
-    "yu": "YU.wav", "yù": "YU.wav", "yú": "YÚ.wav", "yũ": "YŨ.wav",
-
-    "za": "ZA.wav", "zà": "ZA.wav", "zá": "ZÁ.wav", "zã": "ZÃ.wav", 
-    "ze": "ZE.wav", "zè": "ZE.wav", "zé": "ZÉ.wav", "zẽ": "ZẼ.wav",
-    "zɛ": "Zɛ.wav", "zɛ̀": "Zɛ.wav", "zɛ́": "Zɛ́.wav", "zɛ̃": "Zɛ̃.wav", "zƐ̃": "ZƐ̃.wav",
-    "zi": "ZI.wav", "zì": "ZI.wav", "zí": "ZÍ.wav", "zĩ": "ZĨ.wav",
-    "zo": "ZO.wav", "zò": "ZO.wav", "zó": "ZÓ.wav", "zõ": "ZÕ.wav",
-    "zɔ": "Zɔ.wav", "zɔ̀": "Zɔ.wav", "zɔ́": "Zɔ́.wav", "zɔ̃": "Zɔ̃.wav",
-    "zu": "ZU.wav", "zù": "ZU.wav", "zú": "ZÚ.wav", "zũ": "ZŨ.wav",
-    
-    "kpla": "KPLA.wav", "kplà": "KPLA.wav", "kplá": "KPLÁ.wav", "kplã": "KPLÃ.wav",
-    "kple": "KPLE.wav", "kplè": "KPLE.wav", "kplé": "KPLÉ.wav", "kplẽ": "KPLẼ.wav",
-    "kplɛ": "KPLɛ.wav", "kplɛ̀": "KPLɛ.wav", "kplɛ́": "KPLɛ́.wav", "kplɛ̃": "KPLɛ̃.wav", "kplƐ̃": "KPLƐ̃.wav",
-    "kpli": "KPLI.wav", "kplì": "KPLI.wav", "kplí": "KPLÍ.wav", "kplĩ": "KPLĨ.wav",
-    "kplo": "KPLO.wav", "kplò": "KPLO.wav", "kpló": "KPLÓ.wav", "kplõ": "KPLÕ.wav",
-    "kplɔ": "KPLɔ.wav", "kplɔ̀": "KPLɔ.wav", "kplɔ́": "KPLɔ́.wav", "kplɔ̃": "KPLɔ̃.wav",
-    "kplu": "KPLU.wav", "kplù": "KPLU.wav", "kplú": "KPLÚ.wav", "kplũ": "KPLŨ.wav",
-
-    
-
-    "gbla": "GBLA.wav", "gblá": "GBLÁ.wav", "gblã": "GBLÃ.wav", "gblã́": "GBLÃ́.wav",
-    "gble": "GBLE.wav", "gblè": "GBLÈ.wav", "gblé": "GBLÉ.wav", "gblẽ": "GBLẼ.wav",
-    "gblɛ": "GBLɛ.wav", "gblƐ": "GBLƐ.wav", "gblɛ̀": "GBLɛ̀.wav", "gblɛ́": "GBLɛ́.wav", "gblɛ́": "GBLɛ́.wav", "gblɛ̃": "GBLɛ̃.wav", "gblƐ̃": "GBLƐ̃.wav",
-    "gbli": "GBLI.wav", "gblì": "GBLÌ.wav", "gblí": "GBLÍ.wav", "gblĩ": "GBLĨ.wav",
-    "gblo": "GBLO.wav", "gblò": "GBLÒ.wav", "gbló": "GBLÓ.wav", "gblõ": "GBLÕ.wav",
-    "gblɔ": "GBLɔ.wav", "gblɔ̀": "GBLɔ̀.wav", "gblɔ́": "GBLɔ́.wav", "gblɔ̃": "GBLɔ̃.wav",
-    "gblu": "GBLU.wav", "gblu": "GBLÙ.wav", "gblu": "GBLÚ.wav", "gblu": "GBLŨ.wav",
-
-    
-    "kpa": "KPA.wav",
-    "kpà": "KPA.wav",
-    "kpá": "KPÁ.wav",
-    "kpã": "KPÃ.wav",
-    
-    "kpe": "KPE.wav",
-    "kpè": "KPE.wav",
-    "kpé": "KPÉ.wav",
-    "kpẽ": "KPẼ.wav",
-    
-    "kpɛ": "KPɛ.wav",
-    "kpɛ̀": "KPɛ.wav",
-    "kpɛ́": "KPɛ́.wav",
-    "kpɛ̃": "KPɛ̃.wav",
-    "kpƐ̃": "KPƐ̃.wav",
-    
-    "kpi": "KPI.wav",
-    "kpì": "KPI.wav",
-    "kpí": "KPÍ.wav",
-    "kpĩ": "KPĨ.wav",
-    
-    "kpo": "KPO.wav",
-    "kpò": "KPO.wav",
-    "kpó": "KPÓ.wav",
-    "kpõ": "KPÕ.wav",
-    
-    "kpɔ": "KPɔ.wav",
-    "kpɔ̀": "KPɔ.wav",
-    "kpɔ́": "KPɔ́.wav",
-    "kpɔ̃": "KPɔ̃.wav",
-    
-    "kpu": "KPU.wav",
-    "kpù": "KPU.wav",
-    "kpú": "KPÚ.wav",
-    "kpũ": "KPŨ.wav",
-
-    "gba": "GBA.wav",
-    "gbà": "GBA.wav",
-    "gbá": "GBÁ.wav",
-    "gbã": "GBÃ.wav",
-    "gbe": "GBE.wav",
-    "gbè": "GBE.wav",
-    "gbé": "GBÉ.wav",
-    "gbẽ": "GBẼ.wav",
-    "gbɛ": "GBɛ.wav",
-    "gbɛ̀": "GBɛ.wav",
-    "gbɛ́": "GBɛ́.wav",
-    "gbɛ̃": "GBɛ̃.wav",
-    "gbƐ̃": "GBƐ̃.wav",
-    "gbi": "GBI.wav",
-    "gbì": "GBI.wav",
-    "gbí": "GBÍ.wav",
-    "gbĩ": "GBĨ.wav",
-    "gbo": "GBO.wav",
-    "gbò": "GBO.wav",
-    "gbó": "GBÓ.wav",
-    "gbõ": "GBÕ.wav",
-    "gbɔ": "GBɔ.wav",
-    "gbɔ̀": "GBɔ.wav",
-    "gbɔ́": "GBɔ́.wav",
-    "gbɔ̃": "GBɔ̃.wav",
-    "gbu": "GBU.wav",
-    "gbù": "GBU.wav",
-    "gbú": "GBÚ.wav",
-    "gbũ": "GBŨ.wav",
-
-    "tsa": "TSA.wav",
-    "tsà": "TSA.wav",
-    "tsá": "TSÁ.wav",
-    "tsã": "TSÃ.wav",
-    "tse": "TSE.wav",
-    "tsè": "TSE.wav",
-    "tsé": "TSÉ.wav",
-    "tsẽ": "TSẼ.wav",
-    "tsɛ": "TSɛ.wav",
-    "tsɛ̀": "TSɛ.wav",
-    "tsɛ́": "TSɛ́.wav",
-    "tsɛ̃": "TSɛ̃.wav",
-    "tsƐ̃": "TSƐ̃.wav",
-    "tsi": "TSI.wav",
-    "tsì": "TSI.wav",
-    "tsí": "TSÍ.wav",
-    "tsĩ": "TSĨ.wav",
-    "tso": "TSO.wav",
-    "tsò": "TSO.wav",
-    "tsó": "TSÓ.wav",
-    "tsõ": "TSÕ.wav",
-    "tsɔ": "TSɔ.wav",
-    "tsɔ̀": "TSɔ.wav",
-    "tsɔ́": "TSɔ́.wav",
-    "tsɔ̃": "TSɔ̃.wav",
-    "tsu": "TSU.wav",
-    "tsù": "TSU.wav",
-    "tsú": "TSÚ.wav",
-    "tsũ": "TSŨ.wav",
-
-    "tsla": "TSLA.wav",
-    "tslà": "TSLA.wav",
-    "tslá": "TSLÁ.wav",
-    "tslã": "TSLÃ.wav",
-    "tsle": "TSLE.wav",
-    "tslè": "TSLE.wav",
-    "tslé": "TSLÉ.wav",
-    "tslẽ": "TSLẼ.wav",
-    "tslɛ": "TSLɛ.wav",
-    "tslɛ̀": "TSLɛ.wav",
-    "tslɛ́": "TSLɛ́.wav",
-    "tslɛ̃": "TSLɛ̃.wav",
-    "tslƐ̃": "TSLƐ̃.wav",
-    "tsli": "TSLI.wav",
-    "tslì": "TSLI.wav",
-    "tslí": "TSLÍ.wav",
-    "tslĩ": "TSLĨ.wav",
-    "tslo": "TSLO.wav",
-    "tslò": "TSLO.wav",
-    "tsló": "TSLÓ.wav",
-    "tslõ": "TSLÕ.wav",
-    "tslɔ": "TSLɔ.wav",
-    "tslɔ̀": "TSLɔ.wav",
-    "tslɔ́": "TSLɔ́.wav",
-    "tslɔ̃": "TSLɔ̃.wav",
-    "tslu": "TSLU.wav",
-    "tslù": "TSLU.wav",
-    "tslú": "TSLÚ.wav",
-    "tslũ": "TSLŨ.wav",
-
-    "nya": "NYA.wav",
-    "nyà": "NYA.wav",
-    "nyá": "NYÁ.wav",
-    "nyã": "NYÃ.wav",
-    "nye": "NYE.wav",
-    "nyè": "NYE.wav",
-    "nyé": "NYÉ.wav",
-    "nyẽ": "NYẼ.wav",
-    "nyɛ": "NYɛ.wav",
-    "nyɛ̀": "NYɛ.wav",
-    "nyɛ́": "NYɛ́.wav",
-    "nyɛ̃": "NYɛ̃.wav",
-    "nyƐ̃": "NYƐ̃.wav",
-    "nyi": "NYI.wav",
-    "nyì": "NYI.wav",
-    "nyí": "NYÍ.wav",
-    "nyĩ": "NYĨ.wav",
-    "nyo": "NYO.wav",
-    "nyò": "NYO.wav",
-    "nyó": "NYÓ.wav",
-    "nyõ": "NYÕ.wav",
-    "nyɔ": "NYɔ.wav",
-    "nyɔ̀": "NYɔ.wav",
-    "nyɔ́": "NYɔ́.wav",
-    "nyɔ̃": "NYɔ̃.wav",
-    "nyu": "NYU.wav",
-    "nyù": "NYU.wav",
-    "nyú": "NYÚ.wav",
-    "nyũ": "NYŨ.wav",
-
-    "kpa": "KPA.wav",
-    "kpà": "KPA.wav",
-    "kpá": "KPÁ.wav",
-    "kpã": "KPÃ.wav",
-    "kpe": "KPE.wav",
-    "kpè": "KPE.wav",
-    "kpé": "KPÉ.wav",
-    "kpẽ": "KPẼ.wav",
-    "kpɛ": "KPɛ.wav",
-    "kpɛ̀": "KPɛ.wav",
-    "kpɛ́": "KPɛ́.wav",
-    "kpɛ̃": "KPɛ̃.wav",
-    "kpƐ̃": "KPƐ̃.wav",
-    "kpi": "KPI.wav",
-    "kpì": "KPI.wav",
-    "kpí": "KPÍ.wav",
-    "kpĩ": "KPĨ.wav",
-    "kpo": "KPO.wav",
-    "kpò": "KPO.wav",
-    "kpó": "KPÓ.wav",
-    "kpõ": "KPÕ.wav",
-    "kpɔ": "KPɔ.wav",
-    "kpɔ̀": "KPɔ.wav",
-    "kpɔ́": "KPɔ́.wav",
-    "kpɔ̃": "KPɔ̃.wav",
-    "kpu": "KPU.wav",
-    "kpù": "KPU.wav",
-    "kpú": "KPÚ.wav",
-    "kpũ": "KPŨ.wav",
-
-    "kpla": "KPLA.wav",
-    "kplà": "KPLA.wav",
-    "kplá": "KPLÁ.wav",
-    "kplã": "KPLÃ.wav",
-    "kple": "KPLE.wav",
-    "kplè": "KPLE.wav",
-    "kplé": "KPLÉ.wav",
-    "kplẽ": "KPLẼ.wav",
-    "kplɛ": "KPLɛ.wav",
-    "kplɛ̀": "KPLɛ.wav",
-    "kplɛ́": "KPLɛ́.wav",
-    "kplɛ̃": "KPLɛ̃.wav",
-    "kplƐ̃": "KPLƐ̃.wav",
-    "kpli": "KPLI.wav",
-    "kplì": "KPLI.wav",
-    "kplí": "KPLÍ.wav",
-    "kplĩ": "KPLĨ.wav",
-    "kplo": "KPLO.wav",
-    "kplò": "KPLO.wav",
-    "kpló": "KPLÓ.wav",
-    "kplõ": "KPLÕ.wav",
-    "kplɔ": "KPLɔ.wav",
-    "kplɔ̀": "KPLɔ.wav",
-    "kplɔ́": "KPLɔ́.wav",
-    "kplɔ̃": "KPLɔ̃.wav",
-    "kplu": "KPLU.wav",
-    "kplù": "KPLU.wav",
-    "kplú": "KPLÚ.wav",
-    "kplũ": "KPLŨ.wav",
-
-    "ngma": "NGMA.wav",
-    "ngmà": "NGMA.wav",
-    "ngmá": "NGMÁ.wav",
-    "ngmã": "NGMÃ.wav",
-    "ngme": "NGME.wav",
-    "ngmè": "NGME.wav",
-    "ngmé": "NGMÉ.wav",
-    "ngmẽ": "NGMẼ.wav",
-    "ngmɛ": "NGMɛ.wav",
-    "ngmɛ̀": "NGMɛ.wav",
-    "ngmɛ́": "NGMɛ́.wav",
-    "ngmɛ̃": "NGMɛ̃.wav",
-    "ngmƐ̃": "NGMƐ̃.wav",
-    "ngmi": "NGMI.wav",
-    "ngmì": "NGMI.wav",
-    "ngmí": "NGMÍ.wav",
-    "ngmĩ": "NGMĨ.wav",
-    "ngmo": "NGMO.wav",
-    "ngmò": "NGMO.wav",
-    "ngmó": "NGMÓ.wav",
-    "ngmõ": "NGMÕ.wav",
-    "ngmɔ": "NGMɔ.wav",
-    "ngmɔ̀": "NGMɔ.wav",
-    "ngmɔ́": "NGMɔ́.wav",
-    "ngmɔ̃": "NGMɔ̃.wav",
-    "ngmu": "NGMU.wav",
-    "ngmù": "NGMU.wav",
-    "ngmú": "NGMÚ.wav",
-    "ngmũ": "NGMŨ.wav",
-
-    "ngmla": "NGMLA.wav",
-    "ngmlà": "NGMLA.wav",
-    "ngmlá": "NGMLÁ.wav",
-    "ngmlã": "NGMLÃ.wav",
-    "ngmle": "NGMLE.wav",
-    "ngmlè": "NGMLE.wav",
-    "ngmlé": "NGMLÉ.wav",
-    "ngmlẽ": "NGMLẼ.wav",
-    "ngmlɛ": "NGMLɛ.wav",
-    "ngmlɛ̀": "NGMLɛ.wav",
-    "ngmlɛ́": "NGMLɛ́.wav",
-    "ngmlɛ̃": "NGMLɛ̃.wav",
-    "ngmlƐ̃": "NGMLƐ̃.wav",
-    "ngmli": "NGMLI.wav",
-    "ngmlì": "NGMLI.wav",
-    "ngmlí": "NGMLÍ.wav",
-    "ngmlĩ": "NGMLĨ.wav",
-    "ngmlo": "NGMLO.wav",
-    "ngmlò": "NGMLO.wav",
-    "ngmló": "NGMLÓ.wav",
-    "ngmlõ": "NGMLÕ.wav",
-    "ngmlɔ": "NGMLɔ.wav",
-    "ngmlɔ̀": "NGMLɔ.wav",
-    "ngmlɔ́": "NGMLɔ́.wav",
-    "ngmlɔ̃": "NGMLɔ̃.wav",
-    "ngmlu": "NGMLU.wav",
-    "ngmlù": "NGMLU.wav",
-    "ngmlú": "NGMLÚ.wav",
-    "ngmlũ": "NGMLŨ.wav",
-
-    "nga": "NGA.wav",
-    "ngà": "NGA.wav",
-    "ngá": "NGÁ.wav",
-    "ngã": "NGÃ.wav",
-    "ngã́": "NGÃ́.wav",
-    "nge": "NGE.wav",
-    "ngè": "NGE.wav",
-    "ngé": "NGÉ.wav",
-    "ngẽ": "NGẼ.wav",
-    "ngɛ": "NGɛ.wav",
-    "ngɛ̀": "NGɛ.wav",
-    "ngɛ́": "NGɛ́.wav",
-    "ngɛ̃": "NGɛ̃.wav",
-    "ngƐ̃": "NGƐ̃.wav",
-    "ngi": "NGI.wav",
-    "ngì": "NGI.wav",
-    "ngí": "NGÍ.wav",
-    "ngĩ": "NGĨ.wav",
-    "ngo": "NGO.wav",
-    "ngò": "NGO.wav",
-    "ngó": "NGÓ.wav",
-    "ngõ": "NGÕ.wav",
-    "ngɔ": "NGɔ.wav",
-    "ngɔ̀": "NGɔ.wav",
-    "ngɔ́": "NGɔ́.wav",
-    "ngɔ̃": "NGɔ̃.wav",
-    "ngu": "NGU.wav",
-    "ngù": "NGU.wav",
-    "ngú": "NGÚ.wav",
-    "ngũ": "NGŨ.wav",
-
-    "ngla": "NGLA.wav",
-    "nglà": "NGLA.wav",
-    "nglá": "NGLÁ.wav",
-    "nglã": "NGLÃ.wav",
-    "nglã́": "NGLÃ́.wav",
-    "ngle": "NGLE.wav",
-    "nglè": "NGLE.wav",
-    "nglé": "NGLÉ.wav",
-    "nglẽ": "NGLẼ.wav",
-    "nglɛ": "NGLɛ.wav",
-    "nglɛ̀": "NGLɛ.wav",
-    "nglɛ́": "NGLɛ́.wav",
-    "nglɛ̃": "NGLɛ̃.wav",
-    "nglƐ̃": "NGLƐ̃.wav",
-    "ngli": "NGLI.wav",
-    "nglì": "NGLI.wav",
-    "nglí": "NGLÍ.wav",
-    "nglĩ": "NGLĨ.wav",
-    "nglo": "NGLO.wav",
-    "nglò": "NGLO.wav",
-    "ngló": "NGLÓ.wav",
-    "nglõ": "NGLÕ.wav",
-    "nglɔ": "NGLɔ.wav",
-    "nglɔ̀": "NGLɔ.wav",
-    "nglɔ́": "NGLɔ́.wav",
-    "nglɔ̃": "NGLɔ̃.wav",
-    "nglu": "NGLU.wav",
-    "nglù": "NGLU.wav",
-    "nglú": "NGLÚ.wav",
-    "nglũ": "NGLŨ.wav",
-
-    "gbla": "GBLA.wav",
-    "gblà": "GBLA.wav",
-    "gblá": "GBLÁ.wav",
-    "gblã": "GBLÃ.wav",
-    "gblã́": "GBLã́.wav",
-    "gble": "GBLE.wav",
-    "gblè": "GBLE.wav",
-    "gblé": "GBLÉ.wav",
-    "gblẽ": "GBLẼ.wav",
-    "gblɛ": "GBLɛ.wav",
-    "gblɛ̀": "GBLɛ.wav",
-    "gblɛ́": "GBLɛ́.wav",
-    "gblɛ̃": "GBLɛ̃.wav",
-    "gblƐ̃": "GBLƐ̃.wav",
-    "gbli": "GBLI.wav",
-    "gblì": "GBLI.wav",
-    "gblí": "GBLÍ.wav",
-    "gblĩ": "GBLĨ.wav",
-    "gblo": "GBLO.wav",
-    "gblò": "GBLO.wav",
-    "gbló": "GBLÓ.wav",
-    "gblõ": "GBLÕ.wav",
-    "gblɔ": "GBLɔ.wav",
-    "gblɔ̀": "GBLɔ.wav",
-    "gblɔ́": "GBLɔ́.wav",
-    "gblɔ̃": "GBLɔ̃.wav",
-    "gblu": "GBLU.wav",
-    "gblù": "GBLU.wav",
-    "gblú": "GBLÚ.wav",
-    "gblũ": "GBLŨ.wav",
-
-    "nyla": "NYLA.wav",
-    "nylà": "NYLA.wav",
-    "nylá": "NYLÁ.wav",
-    "nylã": "NYLÃ.wav",
-    "nylã́": "NYLÃ́.wav",
-    "nyle": "NYLE.wav",
-    "nylè": "NYLE.wav",
-    "nylé": "NYLÉ.wav",
-    "nylẽ": "NYLẼ.wav",
-    "nylɛ": "NYLɛ.wav",
-    "nylɛ̀": "NYLɛ.wav",
-    "nylɛ́": "NYLɛ́.wav",
-    "nylɛ̃": "NYLɛ̃.wav",
-    "nylƐ̃": "NYLƐ̃.wav",
-    "nyli": "NYLI.wav",
-    "nylì": "NYLI.wav",
-    "nylí": "NYLÍ.wav",
-    "nylĩ": "NYLĨ.wav",
-    "nylo": "NYLO.wav",
-    "nylò": "NYLO.wav",
-    "nyló": "NYLÓ.wav",
-    "nylõ": "NYLÕ.wav",
-    "nylɔ": "NYLɔ.wav",
-    "nylɔ̀": "NYLɔ.wav",
-    "nylɔ́": "NYLɔ́.wav",
-    "nylɔ̃": "NYLɔ̃.wav",
-    "nylu": "NYLU.wav",
-    "nylù": "NYLU.wav",
-    "nylú": "NYLÚ.wav",
-    "nylũ": "NYLŨ.wav",   
-    "₵"   : "SÍDI.wav",
-    "."   : "NGMLÓBI.wav"
-}
-
-# Mapping of numbers to corresponding audio files
-number_to_wav = {
-    0: "0.wav", 
-    1: "1.wav",
-    2: "2.wav",
-    3: "3.wav",
-    4: "4.wav",
-    5: "5.wav",
-    6: "6.wav",
-    7: "7.wav",
-    8: "8.wav",
-    9: "9.wav",
-    10: "10.wav",
-    20: "20-90.wav",
-    30: "20-90.wav",
-    40: "20-90.wav",
-    50: "20-90.wav",
-    60: "20-90.wav",
-    70: "20-90.wav",
-    80: "20-90.wav",
-    90: "20-90.wav",
-    100: "100.wav",
-    1000: "1000.wav",
-    1000000: "1000000.wav",
-    "KƐ": "KƐ.wav"
-}
-
-# Master code dictionary for custom pronunciations
-master_code = {
-    101: ["100.wav", "1.wav", "KƐ.wav", "1.wav"],
-    102: ["100.wav", "1.wav", "KƐ.wav", "2.wav"],
-    103: ["100.wav", "1.wav", "KƐ.wav", "3.wav"],
-    104: ["100.wav", "1.wav", "KƐ.wav", "4.wav"],
-    105: ["100.wav", "1.wav", "KƐ.wav", "5.wav"],
-    106: ["100.wav", "1.wav", "KƐ.wav", "6.wav"],
-    107: ["100.wav", "1.wav", "KƐ.wav", "7.wav"],
-    108: ["100.wav", "1.wav", "KƐ.wav", "8.wav"],
-    109: ["100.wav", "1.wav", "KƐ.wav", "9.wav"],
-    110: ["100.wav", "1.wav", "KƐ.wav", "10.wav"],
-
-    # 1001 to 1010
-    1001: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    1002: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    1003: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    1004: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    1005: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    1006: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    1007: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    1008: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    1009: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    1010: ["1000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 10,001 to 10,010
-    10001: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    10002: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    10003: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    10004: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    10005: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    10006: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    10007: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    10008: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    10009: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    10010: ["10000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 100,001 to 100,010
-    100001: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    100002: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    100003: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    100004: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    100005: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    100006: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    100007: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    100008: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    100009: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    100010: ["100000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 1,000,001 to 1,000,010
-    1000001: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    1000002: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    1000003: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    1000004: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    1000005: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    1000006: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    1000007: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    1000008: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    1000009: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    1000010: ["1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 10,000,001 to 10,000,010
-    10000001: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    10000002: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    10000003: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    10000004: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    10000005: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    10000006: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    10000007: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    10000008: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    10000009: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    10000010: ["10000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 100,000,001 to 100,000,010
-    100000001: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    100000002: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    100000003: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    100000004: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    100000005: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    100000006: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    100000007: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    100000008: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    100000009: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    100000010: ["100000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 1,000,000,001 to 1,000,000,010
-    1000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    1000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    1000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    1000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    1000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    1000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    1000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    1000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    1000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    1000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 10,000,000,001 to 10,000,000,010
-    10000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    10000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    10000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    10000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    10000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    10000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    10000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    10000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    10000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    10000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 100,000,000,001 to 100,000,000,010
-    100000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    100000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    100000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    100000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    100000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    100000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    100000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    100000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    100000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    100000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 1,000,000,000,001 to 1,000,000,000,010
-    1000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    1000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    1000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    1000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    1000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    1000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    1000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    1000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    1000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    1000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 10,000,000,000,001 to 10,000,000,000,010
-    10000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    10000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    10000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    10000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    10000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    10000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    10000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    10000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    10000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    10000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "10.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-    # 100,000,000,000,001 to 100,000,000,000,010
-    100000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "1.wav"],
-    100000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "2.wav"],
-    100000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "3.wav"],
-    100000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "4.wav"],
-    100000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "5.wav"],
-    100000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "6.wav"],
-    100000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "7.wav"],
-    100000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "8.wav"],
-    100000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "9.wav"],
-    100000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "E.wav", "NYÃ.wav", "10.wav"],
-
-
-        # 100,000,000,000,000,001 (100 trillion)
-        10000000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        10000000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        10000000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        10000000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        10000000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        10000000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        10000000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        10000000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        10000000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        10000000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "100.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,000,000,001 (Quadrillion)
-        10000000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        10000000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        10000000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        10000000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        10000000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        10000000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        10000000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        10000000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        10000000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        10000000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "1.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-#2ssssssss
-
-# 101 to 110
-        201: ["100.wav", "2.wav", "KƐ.wav", "1.wav"],
-        202: ["100.wav", "2.wav", "KƐ.wav", "2.wav"],
-        203: ["100.wav", "2.wav", "KƐ.wav", "3.wav"],
-        204: ["100.wav", "2.wav", "KƐ.wav", "4.wav"],
-        205: ["100.wav", "2.wav", "KƐ.wav", "5.wav"],
-        206: ["100.wav", "2.wav", "KƐ.wav", "6.wav"],
-        207: ["100.wav", "2.wav", "KƐ.wav", "7.wav"],
-        208: ["100.wav", "2.wav", "KƐ.wav", "8.wav"],
-        209: ["100.wav", "2.wav", "KƐ.wav", "9.wav"],
-        210: ["100.wav", "2.wav", "KƐ.wav", "10.wav"],
-
-        # 1001 to 1010
-        2001: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        2002: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        2003: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        2004: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        2005: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        2006: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        2007: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        2008: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        2009: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        2010: ["1000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,001 to 10,010
-        20001: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        20002: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        20003: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        20004: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        20005: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        20006: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        20007: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        20008: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        20009: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        20010: ["10000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,001 to 100,010
-        200001: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        200002: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        200003: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        200004: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        200005: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        200006: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        200007: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        200008: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        200009: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        200010: ["100000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,001 to 1,000,010
-        2000001: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        2000002: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        2000003: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        2000004: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        2000005: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        2000006: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        2000007: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        2000008: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        2000009: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        2000010: ["1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,001 to 10,000,010
-        20000001: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        20000002: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        20000003: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        20000004: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        20000005: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        20000006: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        20000007: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        20000008: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        20000009: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        20000010: ["10000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,001 to 100,000,010
-        200000001: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        200000002: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        200000003: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        200000004: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        200000005: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        200000006: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        200000007: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        200000008: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        200000009: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        200000010: ["100000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,001 to 1,000,000,010
-        2000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        2000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        2000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        2000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        2000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        2000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        2000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        2000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        2000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        2000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,000,001 to 10,000,000,010
-        20000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        20000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        20000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        20000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        20000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        20000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        20000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        20000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        20000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        20000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,001 to 100,000,000,010
-        200000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        200000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        200000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        200000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        200000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        200000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        200000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        200000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        200000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        200000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,000,001 to 1,000,000,000,010
-        2000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        2000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        2000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        2000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        2000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        2000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        2000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        2000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        2000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        2000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,000,000,001 to 10,000,000,000,010
-        20000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        20000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        20000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        20000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        20000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        20000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        20000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        20000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        20000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        20000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "20.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,000,001 to 100,000,000,000,010
-        200000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        200000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        200000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        200000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        200000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        200000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        200000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        200000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        200000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        200000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "200.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,000,000,001 to 1,000,000,000,000,010
-        2000000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        2000000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        2000000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        2000000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        2000000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        2000000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        2000000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        2000000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        2000000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        2000000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "2.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        #3ssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssss
-        # 101 to 110
-        301: ["100.wav", "3.wav", "KƐ.wav",  "1.wav"],
-        302: ["100.wav", "3.wav", "KƐ.wav",  "2.wav"],
-        303: ["100.wav", "3.wav", "KƐ.wav",  "3.wav"],
-        304: ["100.wav", "3.wav", "KƐ.wav",  "4.wav"],
-        305: ["100.wav", "3.wav", "KƐ.wav",  "5.wav"],
-        306: ["100.wav", "3.wav", "KƐ.wav",  "6.wav"],
-        307: ["100.wav", "3.wav", "KƐ.wav",  "7.wav"],
-        308: ["100.wav", "3.wav", "KƐ.wav",  "8.wav"],
-        309: ["100.wav", "3.wav", "KƐ.wav",  "9.wav"],
-        310: ["100.wav", "3.wav", "KƐ.wav",  "10.wav"],
-
-        # 1001 to 1010
-        3001: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        3002: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        3003: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        3004: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        3005: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        3006: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        3007: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        3008: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        3009: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        3010: ["1000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,001 to 10,010
-        30001: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        30002: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        30003: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        30004: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        30005: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        30006: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        30007: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        30008: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        30009: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        30010: ["10000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,001 to 100,010
-        300001: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        300002: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        300003: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        300004: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        300005: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        300006: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        300007: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        300008: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        300009: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        300010: ["100000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,001 to 1,000,010
-        3000001: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        3000002: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        3000003: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        3000004: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        3000005: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        3000006: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        3000007: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        3000008: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        3000009: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        3000010: ["1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,001 to 10,000,010
-        30000001: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        30000002: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        30000003: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        30000004: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        30000005: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        30000006: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        30000007: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        30000008: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        30000009: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        30000010: ["10000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,001 to 100,000,010
-        300000001: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        300000002: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        300000003: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        300000004: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        300000005: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        300000006: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        300000007: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        300000008: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        300000009: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        300000010: ["100000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,001 to 1,000,000,010
-        3000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        3000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        3000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        3000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        3000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        3000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        3000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        3000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        3000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        3000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,000,001 to 10,000,000,010
-        30000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        30000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        30000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        30000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        30000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        30000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        30000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        30000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        30000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        30000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,001 to 100,000,000,010
-        300000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        300000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        300000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        300000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        300000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        300000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        300000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        300000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        300000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        300000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,000,001 to 1,000,000,000,010
-        3000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        3000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        3000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        3000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        3000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        3000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        3000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        3000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        3000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        3000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,000,000,001 to 10,000,000,000,010
-        30000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        30000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        30000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        30000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        30000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        30000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        30000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        30000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        30000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        30000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "30.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,000,001 to 100,000,000,000,010
-        300000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        300000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        300000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        300000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        300000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        300000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        300000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        300000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        300000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        300000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "300.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,000,000,001 to 1,000,000,000,000,010
-        3000000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        3000000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        3000000000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        3000000000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        3000000000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        3000000000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        3000000000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        3000000000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        3000000000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        3000000000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "3.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        #4ssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssssss
-        # 101 to 110
-        401: ["100.wav", "4.wav", "KƐ.wav",  "1.wav"],
-        402: ["100.wav", "4.wav", "KƐ.wav",  "2.wav"],
-        403: ["100.wav", "4.wav", "KƐ.wav",  "3.wav"],
-        404: ["100.wav", "4.wav", "KƐ.wav",  "4.wav"],
-        405: ["100.wav", "4.wav", "KƐ.wav",  "5.wav"],
-        406: ["100.wav", "4.wav", "KƐ.wav",  "6.wav"],
-        407: ["100.wav", "4.wav", "KƐ.wav",  "7.wav"],
-        408: ["100.wav", "4.wav", "KƐ.wav",  "8.wav"],
-        409: ["100.wav", "4.wav", "KƐ.wav",  "9.wav"],
-        410: ["100.wav", "4.wav", "KƐ.wav",  "10.wav"],
-
-        # 1001 to 1010
-        4001: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        4002: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        4003: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        4004: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        4005: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        4006: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        4007: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        4008: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        4009: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        4010: ["1000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,001 to 10,010
-        40001: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        40002: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        40003: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        40004: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        40005: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        40006: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        40007: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        40008: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        40009: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        40010: ["10000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,001 to 100,010
-        400001: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        400002: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        400003: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        400004: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        400005: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        400006: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        400007: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        400008: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        400009: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        400010: ["100000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,001 to 1,000,010
-        4000001: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        4000002: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        4000003: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        4000004: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        4000005: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        4000006: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        4000007: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        4000008: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        4000009: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        4000010: ["1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,001 to 10,000,010
-        40000001: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        40000002: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        40000003: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        40000004: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        40000005: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        40000006: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        40000007: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        40000008: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        40000009: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        40000010: ["10000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,001 to 100,000,010
-        400000001: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        400000002: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        400000003: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        400000004: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        400000005: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        400000006: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        400000007: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        400000008: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        400000009: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        400000010: ["100000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,001 to 1,000,000,010
-        4000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        4000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        4000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        4000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        4000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        4000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        4000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        4000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        4000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        4000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 10,000,000,001 to 10,000,000,010
-        40000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        40000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        40000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        40000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        40000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        40000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        40000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        40000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        40000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        40000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 100,000,000,001 to 100,000,000,010
-        400000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        400000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-        400000000003: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "3.wav"],
-        400000000004: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "4.wav"],
-        400000000005: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "5.wav"],
-        400000000006: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "6.wav"],
-        400000000007: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "7.wav"],
-        400000000008: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "8.wav"],
-        400000000009: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "9.wav"],
-        400000000010: ["1000000.wav", "MĨ.wav", "1000000.wav", "400.wav", "KƐ.wav", "NYÃ.wav", "10.wav"],
-
-        # 1,000,000,000,001 to 1,000,000,000,010
-        4000000000001: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "1.wav"],
-        4000000000002: ["1000000.wav", "MĨ.wav", "1000000.wav", "MĨ.wav", "1000000.wav", "4.wav", "KƐ.wav", "NYÃ.wav", "2.wav"],
-}
-
-
-         # Updated function to generate the correct sequence of .wav files for a number
-def generate_wav_sequence(number):
-    if number in master_code:
-        return master_code[number]
-    elif number < 1:
-        return []
+# Phoneme and number tables. data/phoneme_tables.json is the versioned source; it is compiled
+# (trie built, file names interned, small numbers expanded) into a pickle that is loaded on first use.
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+TABLES_SOURCE = os.path.join(DATA_DIR, 'phoneme_tables.json')
+TABLES_COMPILED = os.getenv('PHONEME_TABLES_COMPILED', os.path.join(DATA_DIR, 'phoneme_tables.pickle'))
+TABLES_FORMAT = 1  # Bump whenever the compiled layout changes
+
+_tables = None
+_tables_lock = threading.Lock()
+
+# Function to compile the JSON source into the structures the tokenizer and number engine use
+def compile_tables(source_bytes):
+    source = json.loads(source_bytes)
+
+    # One str object per file name, so every table shares it and the pickle stores it once
+    filenames = {}
+    def intern(file):
+        return filenames.setdefault(file, file)
+
+    valid_word_file_map = {phoneme: intern(file) for phoneme, file in source['valid_word_file_map'].items()}
+    tables = SimpleNamespace(
+        format=TABLES_FORMAT,
+        version=source['version'],
+        source_digest=hashlib.sha256(source_bytes).hexdigest(),
+        valid_word_file_map=valid_word_file_map,
+        trie=compile_phoneme_trie(valid_word_file_map),
+        number_to_wav={(int(key) if key.isdigit() else key): intern(file) for key, file in source['number_to_wav'].items()},
+        master_code={int(number): [intern(file) for file in clips] for number, clips in source['master_code'].items()},
+        master_code_rule_max_exponent={int(digit): exponent for digit, exponent in source['master_code_rule_max_exponent'].items()},
+    )
+    tables.master_code_max_digits = max(max(len(str(number)) for number in tables.master_code),
+                                        max(tables.master_code_rule_max_exponent.values()) + 1)
+    tables.small_number_clips = [tuple(intern(file) for file in clips) for clips in build_small_number_table(tables)]
+    return tables
+
+# Function to write the compiled tables next to the source, atomically so workers never read a partial file
+def save_compiled_tables(tables, path=TABLES_COMPILED):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(vars(tables), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save compiled phoneme tables to {path}: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Function to load the compiled tables, recompiling them if they are missing or older than the source
+def load_phoneme_tables():
+    global _tables
+    with _tables_lock:
+        if _tables is not None:
+            return _tables
+
+        with open(TABLES_SOURCE, 'rb') as f:
+            source_bytes = f.read()
+        source_digest = hashlib.sha256(source_bytes).hexdigest()
+
+        tables = None
+        try:
+            with open(TABLES_COMPILED, 'rb') as f:
+                tables = SimpleNamespace(**pickle.load(f))
+            if getattr(tables, 'format', None) != TABLES_FORMAT or tables.source_digest != source_digest:
+                tables = None
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable compiled phoneme tables {TABLES_COMPILED}: {e}")
+
+        if tables is None:
+            logger.info(f"Compiling phoneme tables from {TABLES_SOURCE}")
+            tables = compile_tables(source_bytes)
+            save_compiled_tables(tables)
+
+        _tables = tables
+        return _tables
+
+def phoneme_tables():
+    return _tables if _tables is not None else load_phoneme_tables()
+
+@app.cli.command('compile-tables')
+def compile_tables_command():
+    """Compile data/phoneme_tables.json into the artifact workers load at startup."""
+    with open(TABLES_SOURCE, 'rb') as f:
+        tables = compile_tables(f.read())
+    save_compiled_tables(tables)
+    click.echo(f"Wrote {TABLES_COMPILED} ({os.path.getsize(TABLES_COMPILED)} bytes, tables version {tables.version})")
+
+@app.cli.command('bench-startup')
+@click.option('--runs', default=5, help='Runs per measurement; the median is reported.')
+def bench_startup_command(runs):
+    """Time building the tables from JSON against loading the compiled artifact, and a fresh import of the app."""
+    with open(TABLES_SOURCE, 'rb') as f:
+        source_bytes = f.read()
+
+    def median_ms(fn):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return sorted(timings)[len(timings) // 2]
+
+    def load_compiled():
+        with open(TABLES_COMPILED, 'rb') as f:
+            pickle.load(f)
+
+    save_compiled_tables(compile_tables(source_bytes))
+    click.echo(f"Compile tables from JSON:  {median_ms(lambda: compile_tables(source_bytes)):.2f} ms")
+    click.echo(f"Load compiled tables:      {median_ms(load_compiled):.2f} ms")
+
+    self_times = sorted(import_times()['app'][0] / 1000 for _ in range(runs))
+    click.echo(f"Import app (module body):  {self_times[len(self_times) // 2]:.2f} ms")
+
+# Function to import the app in a fresh interpreter under `python -X importtime`, returning
+# {module: (self microseconds, cumulative microseconds)}. It runs with this process's environment, so the
+# report shows what every CLI command pays; clips and phoneme tables are loaded on first use, not at import.
+def import_times():
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[0].startswith('import time:') and fields[1].strip().isdigit():
+            times[fields[2].strip()] = (int(fields[0].split(':')[1]), int(fields[1]))
+    if 'app' not in times:
+        raise click.ClickException(f"Importing the app failed:\n{result.stderr[-2000:]}")
+    return times
+
+@app.cli.command('import-report')
+@click.option('--top', default=25, help='Number of modules to list.')
+@click.option('--json', 'as_json', is_flag=True, help='Print JSON for CI to record and compare.')
+def import_report_command(top, as_json):
+    """Report what a fresh `import app` imports and how long it takes, slowest modules first."""
+    times = import_times()
+    total_us = times['app'][1]
+    slowest = sorted(times.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    if as_json:
+        click.echo(json.dumps({
+            "total_us": total_us,
+            "modules": len(times),
+            "slowest": [{"module": name, "self_us": own, "cumulative_us": cumulative} for name, (own, cumulative) in slowest],
+        }, indent=2))
+        return
+    click.echo(f"import app: {total_us / 1000:.1f} ms across {len(times)} modules")
+    for name, (own, cumulative) in slowest:
+        click.echo(f"  {cumulative / 1000:8.1f} ms  {own / 1000:7.1f} ms  {name}")
+
+# The tables used to be module globals; keep app.valid_word_file_map and friends working for outside callers
+def __getattr__(name):
+    if name in ('valid_word_file_map', 'number_to_wav', 'master_code', 'master_code_rule_max_exponent'):
+        return getattr(phoneme_tables(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Clips joining the parts of a number: "KƐ" (and) and "MĨ" (times), used to build the larger scales
+KE_WAV = "KƐ.wav"
+MI_WAV = "MĨ.wav"
+E_WAV = "E.wav"
+NYA_WAV = "NYÃ.wav"
+
+# Numbers made of one leading digit d, zeros, and a final 1 <= u <= 10 (101, 2005, 3000000004, ...) are read
+# "<d followed by zeros> KƐ [E] NYÃ <u>": just "KƐ" for hundreds, and "E" only after a leading 1.
+# master_code_rule_max_exponent gives the highest power of ten each leading digit is read this way for, and
+# master_code lists the custom pronunciations the rule does not produce. data/master_code_reference.json
+# holds the original full table; `flask check-numbers` proves rule + exceptions reproduce it.
+
+# Function to get the custom pronunciation of a number from master_code or its rule, or None
+def master_code_clips(number, tables=None):
+    tables = tables or phoneme_tables()
+    clips = tables.master_code.get(number)
+    if clips is not None:
+        return clips
+
+    units = number % 100
+    if not 1 <= units <= 10:
+        return None
+    lead = str(number - units)
+    digit = int(lead[0])
+    exponent = len(lead) - 1
+    if lead[1:].strip("0") or exponent < 2 or exponent > tables.master_code_rule_max_exponent.get(digit, -1):
+        return None
+
+    number_to_wav = tables.number_to_wav
+    if exponent == 2:
+        return [number_to_wav[100], number_to_wav[digit], KE_WAV, number_to_wav[units]]
+    if exponent <= 8:
+        # Clips exist for every power of ten up to 100000000
+        clips = [f"{10 ** exponent}.wav", number_to_wav[digit]]
     else:
-        base_wavs = {
-            1: "1.wav",
-            2: "2.wav",
-            3: "3.wav",
-            4: "4.wav",
-            5: "5.wav",
-            6: "6.wav",
-            7: "7.wav",
-            8: "8.wav",
-            9: "9.wav",
-            10: "10.wav",
-            20: "20-90.wav",
-            30: "20-90.wav",
-            40: "20-90.wav",
-            50: "20-90.wav",
-            60: "20-90.wav",
-            70: "20-90.wav",
-            80: "20-90.wav",
-            90: "20-90.wav",
-            100: "100.wav",
-            1000: "1000.wav",
-            1000000: "1000000.wav"
-        }
-
-        ke_wav = "KƐ.wav"
-        mi_wav = "MĨ.wav"
-
-        def get_wav(digit):
-            return base_wavs.get(digit, "")
-
-        def handle_teens(num):
-            return [get_wav(10), ke_wav, get_wav(num % 10)]
-
-        def handle_tens(num):
-            tens = (num // 10) * 10
-            units = num % 10
-            if units == 0:
-                return [get_wav(tens)]
-            else:
-                return [get_wav(tens), ke_wav, get_wav(units)]
-            
-            # Function to handle numbers between 20 and 99
-        def handle_tens(num):
-            tens = (num // 10) * 10
-            units = num % 10
-            if units == 0:
-                return [get_wav(tens), get_wav(tens // 10)]
-            else:
-                return [get_wav(tens), get_wav(tens // 10), ke_wav, get_wav(units)]
-
-        def handle_hundreds(num):
-            hundreds = num // 100
-            remainder = num % 100
-            if remainder == 0:
-                return [get_wav(100), get_wav(hundreds)]
-            else:
-                return [get_wav(100), get_wav(hundreds)] + generate_wav_sequence(remainder)
-
-        def handle_thousands(num):
-            thousands = num // 1000
-            remainder = num % 1000
-            if remainder == 0:
-                return [get_wav(1000)] + generate_wav_sequence(thousands)
-            else:
-                return [get_wav(1000)] + generate_wav_sequence(thousands) + generate_wav_sequence(remainder)
-
-        def handle_millions(num):
-            millions = num // 1000000
-            remainder = num % 1000000
-            if remainder == 0:
-                return [get_wav(1000000)] + generate_wav_sequence(millions)
-            else:
-                return [get_wav(1000000)] + generate_wav_sequence(millions) + generate_wav_sequence(remainder)
-
-        def handle_billions(num):
-            billions = num // 1000000000
-            remainder = num % 1000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(billions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(billions) + generate_wav_sequence(remainder)
-
-        def handle_trillions(num):
-            trillions = num // 1000000000000
-            remainder = num % 1000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(trillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(trillions) + generate_wav_sequence(remainder)
-
-        def handle_quadrillions(num):
-            quadrillions = num // 1000000000000000
-            remainder = num % 1000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)
-
-
-        def handle_quintillions(num):
-            quadrillions = num // 1000000000000000000
-            remainder = num % 1000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)
-            
-        
-        def handle_sextillions(num):
-            quadrillions = num // 1000000000000000000000
-            remainder = num % 1000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)    
-            
-         
-        def handle_septillions(num):
-            quadrillions = num // 1000000000000000000000000
-            remainder = num % 1000000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)       
-            
-            
-        def handle_octillions(num):
-            quadrillions = num // 1000000000000000000000000000
-            remainder = num % 1000000000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)           
-            
-            def handle_nonillions(num):
-                quadrillions = num // 1000000000000000000000000000
-            remainder = num % 1000000000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)           
-            
-        
-            def handle_nonillions(num):
-                quadrillions = num // 1000000000000000000000000000
-            remainder = num % 1000000000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)               
-            
-            
-            
-            def handle_decillions(num):
-                deciillions = num // 1000000000000000000000000000
-            remainder = num % 1000000000000000000000000000
-            if remainder == 0:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions)
-            else:
-                return [get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000), mi_wav, get_wav(1000000)] + generate_wav_sequence(quadrillions) + generate_wav_sequence(remainder)           
-            
-            
-        def handle_large_numbers(num):
-            # Define the magnitude names and their corresponding powers of 10
-            magnitudes = [
-                (100, "Hundred"),
-                (1000, "Thousand"),
-                (1000000, "Million"),
-                (1000000000, "Billion"),
-                (1000000000000, "Trillion"),
-                (1000000000000000, "Quadrillion"),
-                (10**18, "Quintillion"),
-                (10**21, "Sextillion"),
-                (10**24, "Septillion"),
-                (10**27, "Octillion"),
-                (10**30, "Nonillion"),
-                (10**33, "Decillion"),
-                (10**36, "Undecillion"),
-                (10**39, "Duodecillion"),
-                (10**42, "Tredecillion"),
-                (10**45, "Quattuordecillion"),
-                (10**48, "Quindecillion"),
-                (10**51, "Sexdecillion"),
-                (10**54, "Septendecillion"),
-                (10**57, "Octodecillion"),
-                (10**60, "Novemdecillion"),
-                (10**63, "Vigintillion"),
-                (10**303, "Centillion")
-            ]
-
-            # Find the appropriate magnitude for the number
-            for magnitude, name in reversed(magnitudes):
-                if num >= magnitude:
-                    quotient = num // magnitude
-                    remainder = num % magnitude
-                    if remainder == 0:
-                        return generate_wav_sequence(quotient) + [get_wav(magnitude)]
-                    else:
-                        return generate_wav_sequence(quotient) + [get_wav(magnitude)] + generate_wav_sequence(remainder)
-            return []
-
-        if number < 11:
-            return [get_wav(number)]
-        elif 11 <= number < 20:
-            return handle_teens(number)
-        elif 20 <= number < 100:
-            return handle_tens(number)
-        elif 100 <= number < 1000:
-            return handle_hundreds(number)
-        elif 1000 <= number < 1000000:
-            return handle_thousands(number)
-        elif 1000000 <= number < 1000000000:
-            return handle_millions(number)
-        elif 1000000000 <= number < 1000000000000:
-            return handle_billions(number)
-        elif 1000000000000 <= number < 1000000000000000:
-            return handle_trillions(number)
-        elif 1000000000000000 <= number < 10**18:
-            return handle_quadrillions(number)
+        clips = scale_clips(exponent // 3, tables) + [f"{digit * 10 ** (exponent % 3)}.wav"]
+    clips.append(KE_WAV)
+    if digit == 1:
+        clips.append(E_WAV)
+    clips += [NYA_WAV, number_to_wav[units]]
+    return clips
+
+# Function to list every number master_code_clips pronounces, with its clips
+def master_code_entries(tables=None):
+    tables = tables or phoneme_tables()
+    entries = dict(tables.master_code)
+    for digit, max_exponent in tables.master_code_rule_max_exponent.items():
+        for exponent in range(2, max_exponent + 1):
+            for units in range(1, 11):
+                number = digit * 10 ** exponent + units
+                entries.setdefault(number, master_code_clips(number, tables))
+    return entries
+
+# Function to build the clip sequence of every number below one thousand, applying master code pronunciations
+def build_small_number_table(tables):
+    number_to_wav = tables.number_to_wav
+    table = []
+    for number in range(1000):
+        custom = master_code_clips(number, tables)
+        if custom is not None:
+            clips = list(custom)
+        elif number < 1:
+            clips = []
+        elif number < 11:
+            clips = [number_to_wav[number]]
+        elif number < 20:
+            clips = [number_to_wav[10], KE_WAV, number_to_wav[number % 10]]
+        elif number < 100:
+            tens, units = divmod(number, 10)
+            clips = [number_to_wav[tens * 10], number_to_wav[tens]]
+            if units:
+                clips += [KE_WAV, number_to_wav[units]]
         else:
-            return handle_large_numbers(number)
+            hundreds, remainder = divmod(number, 100)
+            clips = [number_to_wav[100], number_to_wav[hundreds], *table[remainder]]
+        table.append(tuple(clips))
+    return table
+
+# Function to get the clips naming the scale of the k-th group of three digits: 1000 for k=1,
+# 1000000 for k=2, and one more "MĨ 1000000" for every further power of one thousand
+def scale_clips(group_index, tables=None):
+    number_to_wav = (tables or phoneme_tables()).number_to_wav
+    if group_index == 1:
+        return [number_to_wav[1000]]
+    return [number_to_wav[1000000]] + [MI_WAV, number_to_wav[1000000]] * (group_index - 2)
+
+# Function to generate the correct sequence of .wav files for a number (an int or a string of digits).
+# Works left to right over groups of three digits, with no repeated work beyond the clips it emits. The scale
+# of group k is named with O(k) clips, though, so output and time grow with the square of the number of digits
+# (which is why long digit runs are read digit by digit; see NUMBER_MAX_DIGITS).
+def generate_wav_sequence(number):
+    tables = phoneme_tables()
+    small_number_clips = tables.small_number_clips
+    digits = str(number).lstrip("0")
+    clips = []
+    position = 0
+    length = len(digits)
+    while position < length:
+        remaining = length - position
+        # Once the rest of the number is short enough, it may have its own pronunciation
+        if remaining <= tables.master_code_max_digits:
+            value = int(digits[position:])
+            custom = master_code_clips(value, tables)
+            if custom is not None:
+                clips.extend(custom)
+                return clips
+            if value < 1000:
+                clips.extend(small_number_clips[value])
+                return clips
+
+        group_index = (remaining - 1) // 3
+        group_end = position + remaining - 3 * group_index
+        clips.extend(scale_clips(group_index, tables))
+        clips.extend(small_number_clips[int(digits[position:group_end])])
+
+        # Skip zero digits so the next group read is the next non-zero one
+        position = group_end
+        while position < length and digits[position] == "0":
+            position += 1
+    return clips
+
+# Function to check generate_wav_sequence against the recorded output for 0..1000000
+def verify_number_golden(path=os.path.join(DATA_DIR, 'number_golden.json')):
+    with open(path, encoding='utf-8') as f:
+        golden = json.load(f)
+    failed_blocks = []
+    block_size = golden['block_size']
+    for block, expected in enumerate(golden['digests']):
+        start = golden['start'] + block * block_size
+        digest = hashlib.sha256()
+        for number in range(start, min(start + block_size, golden['stop'] + 1)):
+            digest.update(f"{number}:{','.join(generate_wav_sequence(number))}\n".encode('utf-8'))
+        if digest.hexdigest() != expected:
+            failed_blocks.append((start, min(start + block_size, golden['stop'] + 1) - 1))
+    return golden['start'], golden['stop'], failed_blocks
+
+# Function to compare master code pronunciations with the original table, returning the numbers that differ
+def verify_master_code(path=os.path.join(DATA_DIR, 'master_code_reference.json')):
+    with open(path, encoding='utf-8') as f:
+        reference = {int(number): clips for number, clips in json.load(f).items()}
+    entries = master_code_entries()
+    differing = [number for number, clips in reference.items()
+                 if master_code_clips(number) != clips or generate_wav_sequence(number) != clips]
+    # Numbers the rules pronounce that the original table did not
+    differing += [number for number in entries if number not in reference]
+    return len(reference), sorted(differing)
+
+@app.cli.command('check-numbers')
+def check_numbers_command():
+    """Verify master code rules against the original table, and exhaustively compare
+    generate_wav_sequence with the recorded output for 0..1000000."""
+    reference_size, differing = verify_master_code()
+    click.echo(f"Master code: {len(phoneme_tables().master_code)} exceptions + rules reproduce {reference_size - len(differing)}/{reference_size} original entries")
+    for number in differing[:20]:
+        click.echo(f"  differs: {number}")
+    if differing:
+        raise SystemExit(1)
+
+    start_time = time.perf_counter()
+    start, stop, failed_blocks = verify_number_golden()
+    click.echo(f"Checked {start}..{stop} in {time.perf_counter() - start_time:.1f}s")
+    for first, last in failed_blocks:
+        click.echo(f"  mismatch in {first}..{last}")
+    if failed_blocks:
+        raise SystemExit(1)
+    click.echo("All numbers match")
+
+# Function to re-key a phoneme map in Unicode NFC, so precomposed and combining-mark spellings are one key
+def nfc_phoneme_index(phoneme_map):
+    index = {}
+    for phoneme, file in phoneme_map.items():
+        key = unicodedata.normalize('NFC', phoneme)
+        if index.get(key, file) != file:
+            logger.warning(f"Phoneme {phoneme!r} normalizes to {key!r}, which already maps to {index[key]}; keeping {index[key]}")
+            continue
+        index.setdefault(key, file)
+    return index
+
+# Function to compile a phoneme map into a character trie over its NFC index. Each node is a
+# dict of next character -> child node; the key None holds the file for a phoneme ending there.
+def compile_phoneme_trie(phoneme_map):
+    root = {}
+    for phoneme, file in nfc_phoneme_index(phoneme_map).items():
+        node = root
+        for char in phoneme:
+            node = node.setdefault(char, {})
+        node[None] = file
+    return root
+
+# Version of the text -> clips mapping implemented by normalize_text and split_into_phonemes (whitespace,
+# NFC, number reading, longest match). It is part of every output file name, so bump it whenever either
+# function changes what clips a text gets; otherwise old audio keeps being served under the same name.
+# 2: digit runs longer than NUMBER_MAX_DIGITS are read digit by digit.
+TOKENIZER_VERSION = 2
+
+# Digit runs, with optional thousands separators ("1,250,000"), are read as numbers
+NUMBER_PATTERN = re.compile(r"[0-9]{1,3}(?:,[0-9]{3})+|[0-9]+")
+DIGIT = re.compile(r"[0-9]")
+DIGIT_SPACES = re.compile(r"(?<=[0-9])\s+(?=[0-9])")
+OTHER_SPACES = re.compile(r"(?<![0-9])\s+|\s+(?![0-9])")
+
+# Function to drop whitespace, except a single space between digits so separate numbers stay separate
+def collapse_whitespace(text):
+    if DIGIT.search(text) is None:
+        return "".join(text.split())
+    return OTHER_SPACES.sub("", DIGIT_SPACES.sub(" ", text))
+
+# Digit runs longer than this (phone or account numbers, pasted junk) are read digit by digit: a number's
+# clip count grows with the square of its length, and such runs are rarely repeated, so they are not cached
+NUMBER_MAX_DIGITS = int(os.getenv('NUMBER_MAX_DIGITS', '15'))
+
+# Function to get the clips for a run of digits; common numbers (prices, quantities) repeat a lot
+@functools.lru_cache(maxsize=4096)
+def number_clips(digits):
+    if not digits.strip("0"):
+        return (phoneme_tables().number_to_wav[0],)
+    return tuple(generate_wav_sequence(digits))
+
+# Function to get the clips for a run of digits as it appears in text, keeping long runs out of the cache
+def digit_run_clips(digits):
+    if len(digits) > NUMBER_MAX_DIGITS:
+        return [clip for digit in digits for clip in number_clips(digit)]
+    return number_clips(digits)
+
+# Optional gTTS fallback for text the phoneme map cannot say, e.g. GTTS_FALLBACK_LANG=en.
+# Unset by default: gTTS calls an online service and is only imported once a fallback is needed.
+GTTS_FALLBACK_LANG = os.getenv('GTTS_FALLBACK_LANG')
+FALLBACK_PREFIX = "gtts:"
+
+# Function to append a fallback token for an unmatched run of text, if it has anything to pronounce
+def _append_fallback(text, start, end, phonemes):
+    run = text[start:end]
+    if any(char.isalpha() for char in run):
+        phonemes.append(FALLBACK_PREFIX + run)
+
+# Function to append the longest-match phonemes of text[start:end] to phonemes
+def _match_phonemes(text, start, end, trie, phonemes, fallback=False):
+    unmatched = None  # Start of the current run of characters with no phoneme
+    i = start
+    while i < end:
+        # Walk the trie from position i, remembering the longest phoneme seen
+        node = trie
+        match = None
+        match_end = i
+        j = i
+        while j < end:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            file = node.get(None)
+            if file is not None:
+                match = file
+                match_end = j
+        if match is not None:
+            if unmatched is not None:
+                _append_fallback(text, unmatched, i, phonemes)
+                unmatched = None
+            phonemes.append(match)
+            i = match_end
+        else:
+            # If no sequence is found, move to the next character
+            if fallback and unmatched is None:
+                unmatched = i
+            i += 1
+    if unmatched is not None:
+        _append_fallback(text, unmatched, end, phonemes)
+
+# Function to split text into phonemes or complete words, ignoring spaces, with numbers read out.
+# phoneme_map defaults to the app's map; any other map is compiled into a trie on every call.
+def split_into_phonemes(text, phoneme_map=None):
+    # Remove spaces from the text and bring it into the same form as the trie keys
+    return split_normalized_text(normalize_text(text), phoneme_map)
+
+# Function to split text already passed through normalize_text, as the routes have it for the cache key;
+# normalizing again would cost about as much as the trie walk itself
+def split_normalized_text(text, phoneme_map=None):
+    tables = phoneme_tables()
+    if phoneme_map is None or phoneme_map is tables.valid_word_file_map:
+        trie = tables.trie
+    else:
+        trie = compile_phoneme_trie(phoneme_map)
+    phonemes = []
+    position = 0
+    fallback = GTTS_FALLBACK_LANG is not None
+    if DIGIT.search(text) is not None:
+        for number in NUMBER_PATTERN.finditer(text):
+            _match_phonemes(text, position, number.start(), trie, phonemes, fallback)
+            phonemes.extend(digit_run_clips(number.group().replace(",", "")))
+            position = number.end()
+    _match_phonemes(text, position, len(text), trie, phonemes, fallback)
+    return phonemes
 
-# Function to split text into phonemes or complete words, ignoring spaces
-def split_into_phonemes(text, phoneme_map):
-    # Remove all spaces from the text
+# The original substring-probing tokenizer, kept as the reference for `flask check-tokenizer`
+def _split_into_phonemes_reference(text, phoneme_map, max_length=5):
     text = text.replace(" ", "")
     phonemes = []
     i = 0
     while i < len(text):
-        # Check if the current character or a sequence of characters exists in the phoneme map
-        for j in range(min(len(text), i + 5), i, -1):  # Check sequences up to 5 characters long
+        for j in range(min(len(text), i + max_length), i, -1):
             substring = text[i:j]
             if substring in phoneme_map:
                 phonemes.append(phoneme_map[substring])
                 i = j
                 break
         else:
-            # If no sequence is found, move to the next character
             i += 1
     return phonemes
 
-# Function to concatenate audio files
-def concatenate_audio(files, speed=1.0):
-    combined_audio = np.array([])
+# Function to build a deterministic corpus of phrases and paragraphs from the phoneme map
+def tokenizer_golden_corpus(phoneme_map, seed=0):
+    rng = random.Random(seed)
+    keys = sorted(phoneme_map)
+    noise = [" ", " ", ",", "?", "!", "X", "\n", "\u0301", "\u0303"]
+    corpus = list(keys)
+    for _ in range(5000):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            parts.append(rng.choice(keys))
+            if rng.random() < 0.3:
+                parts.append(rng.choice(noise))
+        corpus.append("".join(parts))
+    paragraphs = [" ".join(rng.choice(keys) for _ in range(300)) for _ in range(50)]
+    return corpus, paragraphs
+
+@app.cli.command('check-tokenizer')
+@click.option('--repeat', default=5, help='Benchmark repetitions over the paragraph corpus.')
+def check_tokenizer_command(repeat):
+    """Verify the trie tokenizer against the reference tokenizer and benchmark both."""
+    valid_word_file_map = phoneme_tables().valid_word_file_map
+    corpus, paragraphs = tokenizer_golden_corpus(valid_word_file_map)
+    longest_key = max(len(key) for key in valid_word_file_map)
+
+    # The trie has no length cap and works on NFC text, so compare against the reference
+    # with the cap lifted, over the NFC index and NFC input
+    nfc_map = nfc_phoneme_index(valid_word_file_map)
+    mismatches = [text for text in corpus + paragraphs
+                  if split_into_phonemes(text) != _split_into_phonemes_reference(unicodedata.normalize('NFC', collapse_whitespace(text)), nfc_map, longest_key)]
+    changed = sum(1 for text in corpus + paragraphs
+                  if split_into_phonemes(text) != _split_into_phonemes_reference(text, valid_word_file_map))
+    click.echo(f"Golden corpus: {len(corpus) + len(paragraphs)} inputs, {len(mismatches)} mismatches")
+    click.echo(f"Inputs that tokenize differently from the original 5-character, non-normalizing tokenizer: {changed}")
+    for text in mismatches[:10]:
+        click.echo(f"  mismatch: {text!r}")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in paragraphs:
+            _split_into_phonemes_reference(text, valid_word_file_map)
+    reference_time = time.perf_counter() - start
+
+    # Requests tokenize text they have already normalized for the cache key, so the trie is timed on that
+    # form; the time including normalize_text is shown as well
+    normalized = [normalize_text(text) for text in paragraphs]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in normalized:
+            split_normalized_text(text)
+    trie_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in paragraphs:
+            split_into_phonemes(text)
+    full_time = time.perf_counter() - start
+
+    characters = sum(len(text) for text in paragraphs) * repeat
+    click.echo(f"Reference: {reference_time * 1000:.1f} ms ({characters / reference_time / 1e6:.2f} M chars/s)")
+    click.echo(f"Trie:      {trie_time * 1000:.1f} ms ({characters / trie_time / 1e6:.2f} M chars/s), "
+               f"{full_time * 1000:.1f} ms including normalize_text")
+    click.echo(f"Speedup:   {reference_time / trie_time:.2f}x, {reference_time / full_time:.2f}x including normalize_text")
+    if mismatches:
+        raise SystemExit(1)
+
+# Seconds between checks of the audio directory for changed clips
+CLIP_BANK_CHECK_INTERVAL = float(os.getenv('CLIP_BANK_CHECK_INTERVAL', '30'))
+
+# How clips are trimmed when they are loaded: 'fixed' cuts a share of the head and tail, 'energy' cuts leading/trailing silence
+CLIP_TRIM_MODE = os.getenv('CLIP_TRIM_MODE', 'fixed')
+CLIP_TRIM_HEAD = float(os.getenv('CLIP_TRIM_HEAD', '0.08'))
+CLIP_TRIM_TAIL = float(os.getenv('CLIP_TRIM_TAIL', '0.2'))
+CLIP_TRIM_THRESHOLD_DB = float(os.getenv('CLIP_TRIM_THRESHOLD_DB', '-40'))  # Relative to the clip's peak
+CLIP_TRIM_FRAME_MS = float(os.getenv('CLIP_TRIM_FRAME_MS', '10'))
+
+# Function to find the [start, end) sample range of a clip that is kept after trimming
+def trim_bounds(data, fs):
+    length = len(data)
+    if CLIP_TRIM_MODE == 'energy' and length:
+        mono = data if data.ndim == 1 else data.mean(axis=1)
+        frame = max(1, int(fs * CLIP_TRIM_FRAME_MS / 1000))
+        frames = length // frame
+        if frames == 0:
+            return 0, length
+        rms = np.sqrt(np.mean(np.square(mono[:frames * frame].reshape(frames, frame)), axis=1))
+        peak = rms.max()
+        if peak <= 0:
+            return 0, length
+        loud = np.nonzero(rms >= peak * 10 ** (CLIP_TRIM_THRESHOLD_DB / 20))[0]
+        # Keep one frame of margin on each side so onsets and releases are not clipped
+        start = max(0, (loud[0] - 1) * frame)
+        end = min(length, (loud[-1] + 2) * frame)
+        return start, end
+
+    # Skip 8% of the audio at the beginning and 20% at the end
+    start = int(CLIP_TRIM_HEAD * length)
+    end = length - int(CLIP_TRIM_TAIL * length)
+    return start, end
+
+# Every clip file the phoneme and number tables can ask for
+def referenced_audio_files():
+    tables = phoneme_tables()
+    files = set(tables.valid_word_file_map.values())
+    files.update(tables.number_to_wav.values())
+    for sequence in master_code_entries().values():
+        files.update(sequence)
+    files.add("MĨ.wav")
+    return files
+
+# Packed clip archive, built with `flask build-clip-archive`: every trimmed clip as float32 PCM in one file.
+# Layout: magic, little-endian uint64 index length, JSON index, zero padding to a page boundary, samples.
+# Workers memory-map it, so deploys ship one file and the page cache is shared between processes.
+CLIP_ARCHIVE = os.getenv('CLIP_ARCHIVE', os.path.join(AUDIO_DIR, 'clips.pack'))
+CLIP_ARCHIVE_MAGIC = b"DMCLIPS1"
+CLIP_ARCHIVE_FORMAT = 2  # 2: sources are recorded as (name, size, SHA-256) rather than (name, mtime, size)
+CLIP_ARCHIVE_ALIGN = 4096
+
+# The trim settings an archive was built with; an archive built with other settings is not used
+def trim_settings():
+    return {
+        "mode": CLIP_TRIM_MODE,
+        "head": CLIP_TRIM_HEAD,
+        "tail": CLIP_TRIM_TAIL,
+        "threshold_db": CLIP_TRIM_THRESHOLD_DB,
+        "frame_ms": CLIP_TRIM_FRAME_MS,
+    }
+
+# One loaded set of clips. It is never changed once built: a reload builds a new snapshot, and a request
+# that takes one snapshot names and renders its output from the same clips even if a reload happens meanwhile.
+class ClipBankSnapshot:
+    def __init__(self, samples, index, missing=(), version=None, source=None, signature=None):
+        # Every trimmed clip lives in one contiguous read-only buffer, indexed by filename -> (start, end, sample rate).
+        # After a fork the buffer's pages are only ever read, so workers share them copy-on-write.
+        # When the bank comes from the archive, the buffer is a memory map of it.
+        self.samples = samples
+        self.index = index
+        self.missing = missing
+        self.version = version  # Digest of the trimmed audio, changes whenever synthesis output could change
+        self.source = source  # 'archive' or 'wav'
+        self.signature = signature
+        self.loaded_at = datetime.utcnow() if source else None
+
+    # Return (samples, sample rate) for a clip; the samples are a view into the shared buffer
+    def get(self, filename):
+        entry = self.index.get(filename)
+        if entry is None:
+            return None
+        start, end, fs = entry
+        return self.samples[start:end], fs
+
+    # Sample rate of the clips, which generated audio is matched to
+    @property
+    def sample_rate(self):
+        for _, _, fs in self.index.values():
+            return fs
+        return None
+
+    def nbytes(self):
+        return self.samples.nbytes
+
+# Decoded, pre-trimmed clips kept in memory so requests never touch the disk
+class ClipBank:
+    def __init__(self, audio_dir, archive_path=None):
+        self.audio_dir = audio_dir
+        self.archive_path = archive_path
+        self.current = ClipBankSnapshot(np.empty(0, dtype=np.float32), {})
+        self.last_check = 0.0
+        self.lock = threading.Lock()
+
+    # (name, mtime, size) of every referenced clip on disk, used to detect changes
+    def _signature(self, files):
+        signature = []
+        for file in sorted(files):
+            try:
+                st = os.stat(os.path.join(self.audio_dir, file))
+            except OSError:
+                continue
+            signature.append((file, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    # [name, size, SHA-256] of every clip in a signature, which unlike mtimes survive a copy or checkout
+    def _source_digests(self, sources):
+        digests = []
+        for file, _, size in sources:
+            try:
+                with open(os.path.join(self.audio_dir, file), 'rb') as f:
+                    digests.append([file, size, hashlib.sha256(f.read()).hexdigest()])
+            except OSError:
+                continue
+        return digests
+
+    # (mtime, size) of the archive, or None if there is none
+    def _archive_stat(self):
+        if not self.archive_path:
+            return None
+        try:
+            st = os.stat(self.archive_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    # Load the clips; with if_unloaded, only if no other thread has loaded them first
+    def load(self, if_unloaded=False):
+        with self.lock:
+            if if_unloaded and self.current.source is not None:
+                return
+            files = referenced_audio_files()
+            sources = self._signature(files)
+            signature = (sources, self._archive_stat())
+            bank = self._open_archive(files, sources) if signature[1] else None
+            source = 'archive' if bank else 'wav'
+            samples, index, missing, version = bank or self._decode(files)
+
+            # Swap in the new snapshot in one assignment so readers never see a half-built bank
+            self.current = ClipBankSnapshot(samples, index, missing, version, source, signature)
+            self.last_check = time.monotonic()
+
+        logger.info(f"Clip bank loaded {len(index)} clips ({samples.nbytes / 1e6:.1f} MB) from "
+                    f"{self.archive_path if source == 'archive' else self.audio_dir}, {len(missing)} missing")
+
+    # Function to decode and trim every clip from the audio directory
+    def _decode(self, files):
+        trimmed = {}
+        missing = []
+        version = hashlib.sha256()
+        for file in sorted(files):
+            filepath = os.path.join(self.audio_dir, file)
+            if not os.path.exists(filepath):
+                missing.append(file)
+                continue
+            try:
+                data, fs = sf.read(filepath, dtype='float32')
+            except Exception as e:
+                logger.error(f"Error reading file {filepath}: {e}")
+                missing.append(file)
+                continue
+            start, end = trim_bounds(data, fs)
+            if trimmed and data.shape[1:] != next(iter(trimmed.values()))[0].shape[1:]:
+                logger.error(f"Skipping {filepath}: channel count differs from the other clips")
+                missing.append(file)
+                continue
+            # Copy out only the trimmed part so the untrimmed decode can be freed
+            trimmed[file] = (np.array(data[start:end]), fs)
+            version.update(f"{file}\0{fs}\0".encode('utf-8'))
+            version.update(trimmed[file][0].tobytes())
+
+        # Pack the trimmed clips back to back into the shared buffer
+        samples, index = self._pack(trimmed)
+        return samples, index, missing, version.hexdigest()[:16]
+
+    @staticmethod
+    def _pack(trimmed):
+        total_length = sum(len(data) for data, _ in trimmed.values())
+        channels = next(iter(trimmed.values()))[0].shape[1:] if trimmed else ()
+        samples = np.empty((total_length,) + channels, dtype=np.float32)
+        index = {}
+        position = 0
+        for file, (data, fs) in trimmed.items():
+            samples[position:position + len(data)] = data
+            index[file] = (position, position + len(data), fs)
+            position += len(data)
+        samples.flags.writeable = False
+        return samples, index
+
+    # Function to memory-map the archive, if it matches the current trim settings and the clips on disk.
+    # With no clips on disk (a deploy that ships only the archive) the archive is used as it is.
+    def _open_archive(self, files, sources):
+        try:
+            with open(self.archive_path, 'rb') as f:
+                if f.read(len(CLIP_ARCHIVE_MAGIC)) != CLIP_ARCHIVE_MAGIC:
+                    raise ValueError("not a clip archive")
+                (index_length,) = struct.unpack('<Q', f.read(8))
+                header = json.loads(f.read(index_length))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable clip archive {self.archive_path}: {e}")
+            return None
+
+        if header.get('format') != CLIP_ARCHIVE_FORMAT or header.get('trim') != trim_settings():
+            logger.warning(f"Ignoring clip archive {self.archive_path}: built with a different format or trim settings")
+            return None
+        # Compare names and sizes first, and hash the clips only if those all match
+        recorded = header.get('sources', [])
+        if sources and ([[file, size] for file, size, _ in recorded] != [[file, size] for file, _, size in sources]
+                        or recorded != self._source_digests(sources)):
+            logger.warning(f"Ignoring clip archive {self.archive_path}: clips in {self.audio_dir} changed since it was built")
+            return None
+
+        shape = (header['length'],) + tuple(header['channels'])
+        if header['length']:
+            data_offset = -(-(len(CLIP_ARCHIVE_MAGIC) + 8 + index_length) // CLIP_ARCHIVE_ALIGN) * CLIP_ARCHIVE_ALIGN
+            samples = np.memmap(self.archive_path, dtype='<f4', mode='r', offset=data_offset, shape=shape)
+        else:
+            samples = np.empty(shape, dtype=np.float32)
+        index = {file: tuple(entry) for file, entry in header['clips'].items()}
+        missing = sorted(set(files) - index.keys())
+        return samples, index, missing, header['version']
+
+    # Function to decode the clips from the audio directory and write them as an archive, atomically
+    def build_archive(self, path):
+        files = referenced_audio_files()
+        sources = self._signature(files)
+        samples, index, missing, version = self._decode(files)
+        header = json.dumps({
+            "format": CLIP_ARCHIVE_FORMAT,
+            "version": version,
+            "trim": trim_settings(),
+            "sources": self._source_digests(sources),
+            "length": len(samples),
+            "channels": list(samples.shape[1:]),
+            "clips": {file: list(entry) for file, entry in index.items()},
+        }, ensure_ascii=False).encode('utf-8')
+        prefix = CLIP_ARCHIVE_MAGIC + struct.pack('<Q', len(header)) + header
+        padding = -len(prefix) % CLIP_ARCHIVE_ALIGN
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(prefix + b"\0" * padding)
+                f.write(samples.astype('<f4', copy=False).tobytes())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return len(index), missing, version
+
+    # Reload the bank if any referenced clip or the archive was added, removed or rewritten
+    def refresh_if_changed(self):
+        now = time.monotonic()
+        if now - self.last_check < CLIP_BANK_CHECK_INTERVAL:
+            return False
+        self.last_check = now
+        if (self._signature(referenced_audio_files()), self._archive_stat()) == self.current.signature:
+            return False
+        logger.info("Audio clips changed, rebuilding clip bank")
+        self.load()
+        return True
+
+    # Function to get the clips a request should use from start to finish, loading them on first use and
+    # reloading them first if they changed
+    def snapshot(self):
+        if self.current.source is None:
+            self.load(if_unloaded=True)
+        else:
+            self.refresh_if_changed()
+        return self.current
+
+    def nbytes(self):
+        return self.current.nbytes()
+
+    def stats(self):
+        current = self.current
+        return {
+            "audio_dir": self.audio_dir,
+            "source": current.source,
+            "archive": self.archive_path if current.source == 'archive' else None,
+            "version": current.version,
+            "clips": len(current.index),
+            "bytes": current.nbytes(),
+            "missing": len(current.missing),
+            "trim_mode": CLIP_TRIM_MODE,
+            "loaded_at": current.loaded_at.isoformat() if current.loaded_at else None,
+        }
+
+# Loaded on first use, or by preload_for_fork in the gunicorn master, so CLI commands that never synthesize
+# (db, prune-activity-logs, check-numbers) do not pay for decoding every clip
+clip_bank = ClipBank(AUDIO_DIR, CLIP_ARCHIVE)
+
+@app.cli.command('build-clip-archive')
+@click.option('--output', default=CLIP_ARCHIVE, show_default=True, help='Where to write the archive.')
+def build_clip_archive_command(output):
+    """Pack every trimmed clip from AUDIO_DIR into one memory-mappable archive for deploys."""
+    clips, missing, version = ClipBank(AUDIO_DIR).build_archive(output)
+    click.echo(f"Wrote {output} ({os.path.getsize(output) / 1e6:.1f} MB, {clips} clips, version {version})")
+    if missing:
+        click.echo(f"Missing from {AUDIO_DIR}: {', '.join(missing)}")
+
+# Function for the gunicorn master (see gunicorn.conf.py) to finish building everything workers only read, before
+# it forks them. gc.freeze() then moves those objects out of the collector's reach: a collection in a worker would
+# otherwise write to every object header it visits and turn the shared pages into private copies.
+def preload_for_fork():
+    phoneme_tables()
+    clip_bank.snapshot()
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Preloaded {clip_bank.nbytes() / 1e6:.1f} MB of clips and froze {gc.get_freeze_count()} objects for the workers")
+
+# Function to read this process's memory from /proc (Linux); shared pages are what forked workers have in common
+def process_memory():
+    memory = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty'):
+                    memory[f"{key.lower()}_kb"] = int(value.split()[0])
+    except OSError:
+        pass
+    return memory
+
+# Function to synthesize text with gTTS, resampled to the clip bank's rate so it can be spliced in
+@functools.lru_cache(maxsize=256)
+def fallback_clip(text, lang, sample_rate):
+    from gtts import gTTS
+
+    buffer = BytesIO()
+    gTTS(text, lang=lang).write_to_fp(buffer)
+    buffer.seek(0)
+    data, fs = sf.read(buffer, dtype='float32')
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    if sample_rate and fs != sample_rate:
+        positions = np.arange(int(len(data) * sample_rate / fs)) * (fs / sample_rate)
+        data = np.interp(positions, np.arange(len(data)), data).astype(np.float32)
+        fs = sample_rate
+    start, end = trim_bounds(data, fs)
+    return np.array(data[start:end]), fs
+
+# Function to look up the pre-trimmed clip for every file, in order, without copying audio
+def plan_segments(files, speed=1.0, clips=None):
+    segments = []
     sample_rate = None
-    valid_files_processed = 0
 
     try:
         speed = float(speed)
     except ValueError:
         speed = 1.0
 
+    if clips is None:
+        clips = clip_bank.snapshot()
+
     for file in files:
-        filepath = os.path.join(audio_dir, file)
-        if os.path.exists(filepath):
+        clip = clips.get(file)
+        if clip is None and file.startswith(FALLBACK_PREFIX):
             try:
-                data, fs = sf.read(filepath)
-                if sample_rate is None:
-                    sample_rate = int(fs * speed)
-
-                if data.dtype != np.float32:
-                    data = data.astype(np.float32)
-
-                # Skip 6% of the audio at the beginning and end
-                start_index = int(0.08 * len(data))
-                end_index = len(data) - int(0.2 * len(data))
-                data = data[start_index:end_index]
-
-                combined_audio = np.concatenate((combined_audio, data))
-                valid_files_processed += 1
+                clip = fallback_clip(file[len(FALLBACK_PREFIX):], GTTS_FALLBACK_LANG, clips.sample_rate)
             except Exception as e:
-                print(f"Error reading file {filepath}: {e}")
+                logger.error(f"gTTS fallback failed for {file!r}: {e}")
+                continue
+        if clip is not None:
+            data, fs = clip
+            if sample_rate is None:
+                sample_rate = int(fs * speed)
+            segments.append(data)
         else:
             print(f"Warning: Audio file not found: {file}")
 
-    if valid_files_processed == 0:
+    return segments, sample_rate
+
+# Raised when a request asks for more than its budget allows
+class SynthesisBudgetExceeded(ValueError):
+    pass
+
+# Function to refuse output longer than max_seconds before any audio is copied
+def check_duration(segments, sample_rate, max_seconds):
+    if not sample_rate or sample_rate <= 0:
+        raise ValueError(f"Invalid output sample rate: {sample_rate!r}")
+    if max_seconds is None:
+        return
+    seconds = sum(len(segment) for segment in segments) / sample_rate
+    if seconds > max_seconds:
+        raise SynthesisBudgetExceeded(f"The audio would be {seconds:.0f} s long; the limit is {max_seconds:.0f} s")
+
+# Function to concatenate audio files
+def concatenate_audio(files, speed=1.0, max_seconds=None, clips=None):
+    segments, sample_rate = plan_segments(files, speed, clips)
+    if not segments:
         raise ValueError("No valid audio files found to process.")
+    check_duration(segments, sample_rate, max_seconds)
+
+    # Size the output once and copy each segment into place, so cost stays linear in the text length
+    total_length = sum(len(segment) for segment in segments)
+    combined_audio = np.empty((total_length,) + segments[0].shape[1:], dtype=np.float32)
+    position = 0
+    for segment in segments:
+        combined_audio[position:position + len(segment)] = segment
+        position += len(segment)
+
     return combined_audio, sample_rate
 
+# Function to bring user input into the form used for tokenizing and cache keys
+def normalize_text(text):
+    # The tokenizer ignores whitespace (except between numbers), so texts differing only in spacing
+    # synthesize identically, and equivalent Unicode spellings share one NFC form
+    return unicodedata.normalize('NFC', collapse_whitespace(text.strip()))
+
+# Speeds a client may ask for. Requests are rounded to SPEED_STEP, so near-identical values share one
+# cache file and one phrase count instead of each float getting its own.
+SPEED_MIN = 0.5
+SPEED_MAX = 2.0
+SPEED_STEP = 0.05
+
+# Function to read a speed setting: missing means normal speed, anything else must be a finite number
+# in [SPEED_MIN, SPEED_MAX]. Raises ValueError otherwise.
+def parse_speed(speed):
+    if speed is None or speed == '':
+        return 1.0
+    try:
+        value = float(speed)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value) or not SPEED_MIN <= value <= SPEED_MAX:
+        raise ValueError(f"speed must be a number from {SPEED_MIN} to {SPEED_MAX}")
+    return round(round(value / SPEED_STEP) * SPEED_STEP, 2)
+
+# Function to name the output file for a text: a digest of the text, the speed and everything that decides
+# which clips are used and what they sound like (tokenizer version and settings, phoneme tables, clip bank)
+def output_filename(normalized_text, speed, clips=None):
+    if clips is None:
+        clips = clip_bank.snapshot()
+    key = (f"{normalized_text}\0{speed!r}\0{clips.version}\0"
+           f"tables:{phoneme_tables().source_digest}\0tokenizer:{TOKENIZER_VERSION}\0digits:{NUMBER_MAX_DIGITS}")
+    if GTTS_FALLBACK_LANG is not None:
+        key += f"\0gtts:{GTTS_FALLBACK_LANG}"
+    return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.wav"
+
+# Function to write a WAV file so other workers never see it half-written
+def write_audio_atomically(filepath, audio, sample_rate):
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        sf.write(tmp_path, audio, sample_rate, format='WAV')
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Generated audio lives in its own directory, kept within a byte and entry budget
+OUTPUT_DIR = os.getenv('OUTPUT_CACHE_DIR', os.path.join(AUDIO_DIR, 'generated'))
+OUTPUT_CACHE_MAX_BYTES = int(os.getenv('OUTPUT_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+OUTPUT_CACHE_MAX_ENTRIES = int(os.getenv('OUTPUT_CACHE_MAX_ENTRIES', '5000'))
+# A sweep evicts down to this share of the budget, so the next sweep is only needed after that much is stored again
+OUTPUT_CACHE_LOW_WATER = float(os.getenv('OUTPUT_CACHE_LOW_WATER', '0.9'))
+# Other workers store into the same directory; the running totals are recounted from disk at least this often
+OUTPUT_CACHE_RESYNC_INTERVAL = float(os.getenv('OUTPUT_CACHE_RESYNC_INTERVAL', '60'))
+
+# Disk cache of synthesized files with least-recently-used eviction.
+# A file's mtime is its last access time: it is bumped on every hit and download, since atime is often disabled.
+# Entry and byte totals are kept as files are stored, so the directory is only scanned when over budget.
+class OutputCache:
+    def __init__(self, directory, max_bytes, max_entries):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.auto_sweep = True  # Sweep after every store; bulk rendering sweeps once at the end instead
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries = 0
+        self.bytes = 0
+        self.last_sweep = 0.0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    # Returns True if the file is cached, without counting or marking it as used
+    def contains(self, filename):
+        return os.path.exists(self.path(filename))
+
+    # Returns True if the file is cached, marking it as recently used
+    def lookup(self, filename):
+        try:
+            os.utime(self.path(filename))
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    # Marks a file as recently used, e.g. when it is downloaded, without counting a hit
+    def touch(self, filename):
+        try:
+            os.utime(self.path(filename))
+        except FileNotFoundError:
+            pass
+
+    def store(self, filename, audio, sample_rate):
+        filepath = self.path(filename)
+        try:
+            previous_size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            previous_size = None
+        write_audio_atomically(filepath, audio, sample_rate)
+        try:
+            size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            size = 0  # Evicted by another worker already
+        with self.lock:
+            self.entries += previous_size is None
+            self.bytes += size - (previous_size or 0)
+            needs_sweep = (self.bytes > self.max_bytes or self.entries > self.max_entries
+                           or time.monotonic() - self.last_sweep > OUTPUT_CACHE_RESYNC_INTERVAL)
+        if self.auto_sweep and needs_sweep:
+            self.sweep()
+
+    # Recount the cache from disk and, if it is over budget, evict the least recently used files
+    # until it is back under the low-water mark
+    def sweep(self):
+        with self.lock:
+            files = []
+            total_bytes = 0
+            stale_before = time.time() - 3600
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.wav'):
+                        # Temporary files left behind by a killed writer
+                        if entry.name.endswith('.tmp'):
+                            try:
+                                if entry.stat().st_mtime < stale_before:
+                                    os.remove(entry.path)
+                            except FileNotFoundError:
+                                pass
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total_bytes += st.st_size
+
+            if total_bytes > self.max_bytes or len(files) > self.max_entries:
+                target_bytes = self.max_bytes * OUTPUT_CACHE_LOW_WATER
+                target_entries = int(self.max_entries * OUTPUT_CACHE_LOW_WATER)
+                files.sort()
+                evict = 0
+                while evict < len(files) and (total_bytes > target_bytes or len(files) - evict > target_entries):
+                    _, size, path = files[evict]
+                    try:
+                        os.remove(path)
+                        self.evictions += 1
+                    except FileNotFoundError:
+                        pass  # Another worker evicted it first
+                    total_bytes -= size
+                    evict += 1
+                files = files[evict:]
+                logger.info(f"Output cache evicted {evict} files")
+
+            self.entries = len(files)
+            self.bytes = total_bytes
+            self.last_sweep = time.monotonic()
+
+    def stats(self):
+        return {
+            "directory": self.directory,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+output_cache = OutputCache(OUTPUT_DIR, OUTPUT_CACHE_MAX_BYTES, OUTPUT_CACHE_MAX_ENTRIES)
+output_cache.sweep()
+
+# Older versions wrote every output as output_<hash(text)>.wav into AUDIO_DIR itself and never removed it
+LEGACY_OUTPUT_NAME = re.compile(r"output_-?[0-9]+\.wav")
+
+# Function to delete those files, which nothing reads any more; cheap once they are gone, so it runs at every start
+def remove_legacy_outputs(directory):
+    removed = 0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if LEGACY_OUTPUT_NAME.fullmatch(entry.name) and entry.is_file():
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass  # Another worker removed it first
+    if removed:
+        logger.info(f"Removed {removed} old output files from {directory}")
+    return removed
+
+remove_legacy_outputs(AUDIO_DIR)
+
+# Function to synthesize normalized text into the output cache, returning the file name and whether it was cached
+def synthesize_to_cache(normalized_text, speed=1.0, phonemes=None, max_seconds=None):
+    # Name and render the file from one snapshot, so a concurrent reload cannot pair old name and new audio
+    clips = clip_bank.snapshot()
+    filename = output_filename(normalized_text, speed, clips)
+    if output_cache.lookup(filename):
+        return filename, True
+
+    if phonemes is None:
+        phonemes = split_normalized_text(normalized_text)
+    logger.info(f"Phonemes: {len(phonemes)} clips")
+
+    combined_audio, sample_rate = concatenate_audio(phonemes, speed, max_seconds, clips)
+    output_cache.store(filename, combined_audio, sample_rate)
+    logger.info(f"Audio file saved at: {output_cache.path(filename)}")
+    return filename, False
+
+# Synthesis admission control for requests. At most SYNTHESIS_CONCURRENCY syntheses run at once in a process;
+# up to SYNTHESIS_QUEUE_SIZE more wait, each for at most SYNTHESIS_QUEUE_TIMEOUT seconds. Anything beyond that
+# is turned away at once with 503, and a user with SYNTHESIS_PER_USER_LIMIT requests already running or
+# waiting gets 429, so one client cannot fill the queue. Cache hits never need a slot.
+SYNTHESIS_CONCURRENCY = int(os.getenv('SYNTHESIS_CONCURRENCY', '1'))
+SYNTHESIS_QUEUE_SIZE = int(os.getenv('SYNTHESIS_QUEUE_SIZE', '2'))
+SYNTHESIS_QUEUE_TIMEOUT = float(os.getenv('SYNTHESIS_QUEUE_TIMEOUT', '10'))
+SYNTHESIS_PER_USER_LIMIT = int(os.getenv('SYNTHESIS_PER_USER_LIMIT', '2'))
+# Per-request budgets: normalized characters of input and seconds of output audio
+SYNTHESIS_MAX_TEXT_LENGTH = int(os.getenv('SYNTHESIS_MAX_TEXT_LENGTH', '2000'))
+SYNTHESIS_MAX_SECONDS = float(os.getenv('SYNTHESIS_MAX_SECONDS', '120'))
+
+class SynthesisRejected(Exception):
+    def __init__(self, status, message, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class SynthesisScheduler:
+    def __init__(self, concurrency, queue_size, queue_timeout, per_user_limit):
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.per_user_limit = per_user_limit
+        self.condition = threading.Condition()
+        self.active = 0
+        self.waiting = 0
+        self.per_user = {}  # user id -> requests running or waiting
+        self.max_waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_full = 0
+        self.rejected_user = 0
+        self.timed_out = 0
+        self.wait_times = collections.deque(maxlen=1000)  # Seconds spent waiting, for admitted requests that queued
+        self.service_time = None  # Moving average of seconds holding a slot
+
+    # Seconds a client should wait before retrying, from the work ahead of it
+    def _retry_after(self):
+        service_time = self.service_time or 1.0
+        return max(1, math.ceil(service_time * (self.waiting + 1) / self.concurrency))
+
+    @contextlib.contextmanager
+    def slot(self, user_id=None):
+        with self.condition:
+            if self.per_user.get(user_id, 0) >= self.per_user_limit:
+                self.rejected_user += 1
+                raise SynthesisRejected(429, "Too many requests in progress for this user", self._retry_after())
+            if self.active >= self.concurrency and self.waiting >= self.queue_size:
+                self.rejected_full += 1
+                raise SynthesisRejected(503, "Synthesis is at capacity", self._retry_after())
+            self.per_user[user_id] = self.per_user.get(user_id, 0) + 1
+            try:
+                if self.active >= self.concurrency:
+                    self.waiting += 1
+                    self.queued += 1
+                    self.max_waiting = max(self.max_waiting, self.waiting)
+                    start = time.monotonic()
+                    try:
+                        admitted = self.condition.wait_for(lambda: self.active < self.concurrency, self.queue_timeout)
+                    finally:
+                        self.waiting -= 1
+                    if not admitted:
+                        self.timed_out += 1
+                        raise SynthesisRejected(503, "Timed out waiting for synthesis capacity", self._retry_after())
+                    self.wait_times.append(time.monotonic() - start)
+                self.active += 1
+                self.admitted += 1
+            except BaseException:
+                self._release_user(user_id)
+                raise
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self.condition:
+                self.active -= 1
+                self._release_user(user_id)
+                self.service_time = elapsed if self.service_time is None else 0.9 * self.service_time + 0.1 * elapsed
+                self.condition.notify()
+
+    def _release_user(self, user_id):
+        remaining = self.per_user.get(user_id, 0) - 1
+        if remaining > 0:
+            self.per_user[user_id] = remaining
+        else:
+            self.per_user.pop(user_id, None)
+
+    def stats(self):
+        waits = sorted(self.wait_times)
+        return {
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_full": self.rejected_full,
+            "rejected_user": self.rejected_user,
+            "timed_out": self.timed_out,
+            "wait_ms_p50": waits[len(waits) // 2] * 1000 if waits else None,
+            "wait_ms_p95": waits[int(len(waits) * 0.95)] * 1000 if waits else None,
+            "service_ms_avg": self.service_time * 1000 if self.service_time is not None else None,
+        }
+
+synthesis_scheduler = SynthesisScheduler(SYNTHESIS_CONCURRENCY, SYNTHESIS_QUEUE_SIZE, SYNTHESIS_QUEUE_TIMEOUT, SYNTHESIS_PER_USER_LIMIT)
+
+def rejection_response(rejection):
+    response = jsonify({"error": str(rejection)})
+    response.status_code = rejection.status
+    response.headers["Retry-After"] = str(rejection.retry_after)
+    return response
+
+# Offline rendering of a whole corpus (`flask render-corpus`) into the same cache /pronounce serves from.
+# Items already in the cache are skipped, so an interrupted run picks up where it stopped.
+def read_corpus(path, text_column, speed_column, default_speed):
+    entries = []
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if path.lower().endswith('.csv'):
+            for line, row in enumerate(csv.DictReader(f), 2):
+                if text_column not in row:
+                    raise click.ClickException(f"{path} has no '{text_column}' column")
+                try:
+                    speed = parse_speed(row.get(speed_column)) if speed_column and row.get(speed_column) else default_speed
+                except ValueError as e:
+                    raise click.ClickException(f"{path}, line {line}: {e}")
+                entries.append((line, row[text_column] or "", speed))
+        else:
+            for line, text in enumerate(f, 1):
+                entries.append((line, text.rstrip('\n'), default_speed))
+    return entries
+
+# Pool workers are forked from the command's process, so they share its clip bank and tables
+def _init_render_worker():
+    output_cache.auto_sweep = False
+    logger.setLevel(logging.WARNING)
+
+def _render_corpus_item(item):
+    text, speed = item
+    try:
+        filename, cached = synthesize_to_cache(text, speed)
+    except Exception as e:
+        return text, speed, None, f"error: {e}"
+    return text, speed, filename, 'cached' if cached else 'rendered'
+
+@app.cli.command('render-corpus')
+@click.argument('corpus', type=click.Path(exists=True, dir_okay=False))
+@click.option('--text-column', default='text', show_default=True, help='CSV column holding the text.')
+@click.option('--speed-column', default=None, help='CSV column holding a per-row speed.')
+@click.option('--speed', default=1.0, show_default=True, help='Speed for rows without one.')
+@click.option('--workers', default=os.cpu_count() or 1, show_default=True, help='Processes to render with.')
+@click.option('--manifest', default=None, help='Where to write the manifest; defaults to CORPUS.manifest.csv.')
+def render_corpus_command(corpus, text_column, speed_column, speed, workers, manifest):
+    """Render every line of a text file, or every row of a CSV, into the output cache and write a manifest
+    mapping each line to its file. Rerunning after an interruption only renders what is missing."""
+    try:
+        speed = parse_speed(speed)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--speed')
+    entries = [(line, normalize_text(text), item_speed) for line, text, item_speed in read_corpus(corpus, text_column, speed_column, speed)]
+    distinct = list(dict.fromkeys((text, item_speed) for _, text, item_speed in entries if text))
+    results = {}
+    pending = []
+    for key in distinct:
+        filename = output_filename(*key)
+        if output_cache.contains(filename):
+            results[key] = (filename, 'cached')
+        else:
+            pending.append(key)
+    click.echo(f"{len(entries)} lines, {len(distinct)} distinct, {len(results)} already rendered, {len(pending)} to render")
+    if len(distinct) > output_cache.max_entries:
+        click.echo(f"Warning: {len(distinct)} files exceed OUTPUT_CACHE_MAX_ENTRIES={output_cache.max_entries}; "
+                   f"the oldest will be evicted", err=True)
+
+    manifest = manifest or f"{corpus}.manifest.csv"
+    start = time.perf_counter()
+    try:
+        if pending:
+            preload_for_fork()
+            with multiprocessing.get_context('fork').Pool(workers, initializer=_init_render_worker) as pool:
+                for done, (text, item_speed, filename, status) in enumerate(pool.imap_unordered(_render_corpus_item, pending, chunksize=8), 1):
+                    results[text, item_speed] = (filename, status)
+                    if done % 500 == 0 or done == len(pending):
+                        click.echo(f"{done}/{len(pending)} rendered ({done / (time.perf_counter() - start):.0f}/s)")
+    finally:
+        output_cache.sweep()
+        tmp_path = f"{manifest}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['line', 'speed', 'file', 'status', 'text'])
+            for line, text, item_speed in entries:
+                filename, status = results.get((text, item_speed), (None, 'pending' if text else 'empty'))
+                writer.writerow([line, item_speed, filename or '', status, text])
+        os.replace(tmp_path, manifest)
+    errors = sum(1 for _, status in results.values() if status.startswith('error'))
+    click.echo(f"Wrote {manifest}; {errors} errors")
+
+# Cache warmup: render the most requested phrases that are not in the output cache yet, most frequent first.
+# Runs at lowered CPU priority with a pause between items so it yields to live requests, and holds a file
+# lock in the output directory so only one process warms at a time.
+CACHE_WARMUP_ON_START = int(os.getenv('CACHE_WARMUP_ON_START', '0'))  # Top-N phrases each worker tries to warm at startup
+CACHE_WARMUP_PAUSE = float(os.getenv('CACHE_WARMUP_PAUSE', '0.01'))
+CACHE_WARMUP_NICE = int(os.getenv('CACHE_WARMUP_NICE', '10'))
+
+warmup_status = {"state": "idle", "rendered": 0, "cached": 0, "failed": 0, "started_at": None, "finished_at": None}
+
+def warm_output_cache(top, pause=CACHE_WARMUP_PAUSE):
+    with open(os.path.join(output_cache.directory, '.warmup.lock'), 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            warmup_status["state"] = "skipped: another process is warming"
+            return warmup_status
+        warmup_status.update(state="running", rendered=0, cached=0, failed=0,
+                             started_at=datetime.utcnow().isoformat(), finished_at=None)
+        with app.app_context():
+            phrases = (db.session.query(PhraseFrequency.text, PhraseFrequency.speed)
+                       .order_by(PhraseFrequency.count.desc(), PhraseFrequency.last_requested.desc())
+                       .limit(top).all())
+            db.session.remove()
+        for text, speed in phrases:
+            try:
+                _, cached = synthesize_to_cache(text, speed)
+            except Exception as e:
+                logger.warning(f"Cache warmup could not render a phrase: {e}")
+                warmup_status["failed"] += 1
+                continue
+            warmup_status["cached" if cached else "rendered"] += 1
+            if not cached and pause:
+                time.sleep(pause)
+        warmup_status.update(state="done", finished_at=datetime.utcnow().isoformat())
+        logger.info(f"Cache warmup rendered {warmup_status['rendered']} phrases, {warmup_status['cached']} were already cached")
+    return warmup_status
+
+# Function to warm the cache from a background thread; gunicorn.conf.py calls it in each worker after fork
+def start_cache_warmup(top=CACHE_WARMUP_ON_START):
+    if top <= 0:
+        return None
+
+    def run():
+        try:
+            # Lower this thread's priority only (Linux schedules threads individually)
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), CACHE_WARMUP_NICE)
+        except (AttributeError, OSError):
+            pass
+        try:
+            warm_output_cache(top)
+        except Exception as e:
+            warmup_status["state"] = f"failed: {e}"
+            logger.error(f"Cache warmup failed: {e}")
+
+    thread = threading.Thread(target=run, name='cache-warmup', daemon=True)
+    thread.start()
+    return thread
+
+@app.cli.command('warm-cache')
+@click.option('--top', default=1000, show_default=True, help='How many of the most requested phrases to render.')
+@click.option('--pause', default=0.0, show_default=True, help='Seconds to wait after each rendered phrase.')
+def warm_cache_command(top, pause):
+    """Pre-render the most requested phrases into the output cache, e.g. from a deploy hook or cron."""
+    status = warm_output_cache(top, pause)
+    click.echo(f"Warmup {status['state']}: {status['rendered']} rendered, {status['cached']} already cached, {status['failed']} failed")
+
+# Function to build a 16-bit PCM WAV header for a known number of frames
+# Raises ValueError for a rate or size the 32-bit header fields cannot hold, so callers can build it before
+# a response starts instead of failing mid-stream
+def wav_header(frames, sample_rate, channels=1, sample_width=2):
+    data_size = frames * channels * sample_width
+    if not 0 < sample_rate * channels * sample_width <= 0xFFFFFFFF:
+        raise ValueError(f"Invalid output sample rate: {sample_rate!r}")
+    if 36 + data_size > 0xFFFFFFFF:
+        raise ValueError("The audio is too long for a WAV file")
+    return b"".join([
+        b"RIFF", struct.pack("<I", 36 + data_size), b"WAVE",
+        b"fmt ", struct.pack("<IHHIIHH", 16, 1, channels, sample_rate,
+                             sample_rate * channels * sample_width, channels * sample_width, sample_width * 8),
+        b"data", struct.pack("<I", data_size),
+    ])
+
+# Function to convert a float32 segment to 16-bit PCM bytes, scaled the way libsndfile does
+# so streamed audio is sample-identical to the files written with sf.write
+def pcm16_bytes(segment):
+    return np.clip(np.floor(segment * 32768), -32768, 32767).astype('<i2').tobytes()
+
+# Function to yield a WAV file segment by segment: the prebuilt header first, then each clip as soon as it is converted
+def stream_wav(header, segments):
+    yield header
+    for segment in segments:
+        yield pcm16_bytes(segment)
+
 # Home route
 @app.route('/')
 def home():
@@ -1662,6 +1960,7 @@ def login():
 @app.route('/logout')
 @login_required
 def logout():
+    user_cache.invalidate(current_user.id)
     logout_user()
     return redirect(url_for('login'))
 
@@ -1679,6 +1978,7 @@ def register():
         user.set_password(password)
         db.session.add(user)
         db.session.commit()
+        user_cache.invalidate(user.id)  # The id may have belonged to a deleted user
         log_activity(user.id, user.username, request.remote_addr, "Registered")
         flash('Your account has been created! You are now able to log in', 'success')
         return redirect(url_for('login'))
@@ -1700,39 +2000,392 @@ def pronounce():
 
     logger.info(f"Received text: {text}")
 
-    phonemes = split_into_phonemes(text, valid_word_file_map)
-    logger.info(f"Phonemes: {phonemes}")
-
-    filename = f"output_{hash(text)}.wav"
-    filepath = os.path.join(AUDIO_DIR, filename)
-
+    normalized_text = normalize_text(text)
+    if not normalized_text:
+        return jsonify({"error": "No text provided"}), 400
     try:
-        combined_audio, sample_rate = concatenate_audio(phonemes)
-        sf.write(filepath, combined_audio, sample_rate)
-        logger.info(f"Audio file saved at: {filepath}")
+        speed = parse_speed(request.form.get('speed'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if len(normalized_text) > SYNTHESIS_MAX_TEXT_LENGTH:
+        return jsonify({"error": f"Text is longer than {SYNTHESIS_MAX_TEXT_LENGTH} characters"}), 413
 
-        if os.path.exists(filepath):
-            logger.info("Audio file exists.")
-        else:
-            logger.error("Audio file was not created.")
-            return jsonify({"error": "Failed to generate audio file"}), 500
+    try:
+        # Only a cache miss has to wait for a synthesis slot
+        needs_slot = not output_cache.contains(output_filename(normalized_text, speed))
+        with synthesis_scheduler.slot(current_user.id) if needs_slot else contextlib.nullcontext():
+            filename, cached = synthesize_to_cache(normalized_text, speed, max_seconds=SYNTHESIS_MAX_SECONDS)
+        if cached:
+            logger.info(f"Output cache hit: {filename}")
+        phrase_recorder.record(normalized_text, speed)
+        log_activity(current_user.id, current_user.username, request.remote_addr, "Pronounced text", droppable=True)
 
         audio_url = url_for('serve_audio', filename=filename, _external=True)
         logger.info(f"Audio URL: {audio_url}")
         return jsonify({"audio_url": audio_url})
+    except SynthesisRejected as e:
+        return rejection_response(e)
+    except SynthesisBudgetExceeded as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         logger.error(f"Error generating audio: {e}")
         return jsonify({"error": "Failed to generate audio"}), 500
 
+# Limits on one batch request
+PRONOUNCE_BATCH_MAX_ITEMS = int(os.getenv('PRONOUNCE_BATCH_MAX_ITEMS', '500'))
+PRONOUNCE_BATCH_MAX_CHARS = int(os.getenv('PRONOUNCE_BATCH_MAX_CHARS', '100000'))
+
+# Batch TTS route: takes {"items": [{"text": ..., "speed": ...} or "text", ...], "format": "manifest" | "zip"}.
+# Identical items (after normalization) are synthesized once, and each distinct text is tokenized once
+# whatever speeds it is asked for. Returns a manifest of URLs in item order, or a zip of the files plus the manifest.
+@app.route('/pronounce/batch', methods=['POST'])
+@login_required
+def pronounce_batch():
+    payload = request.get_json(silent=True)
+    items = payload.get('items') if isinstance(payload, dict) else payload
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "Expected a JSON array of items"}), 400
+    if len(items) > PRONOUNCE_BATCH_MAX_ITEMS:
+        return jsonify({"error": f"At most {PRONOUNCE_BATCH_MAX_ITEMS} items per batch"}), 413
+    output_format = payload.get('format', 'manifest') if isinstance(payload, dict) else 'manifest'
+    if output_format not in ('manifest', 'zip'):
+        return jsonify({"error": "format must be 'manifest' or 'zip'"}), 400
+
+    requested = []
+    for item in items:
+        text, speed = (item.get('text'), item.get('speed', 1.0)) if isinstance(item, dict) else (item, 1.0)
+        if not isinstance(text, str):
+            return jsonify({"error": "Every item needs a text"}), 400
+        try:
+            requested.append((normalize_text(text), parse_speed(speed)))
+        except ValueError as e:
+            return jsonify({"error": f"Item {len(requested)}: {e}"}), 400
+    if sum(len(text) for text, _ in requested) > PRONOUNCE_BATCH_MAX_CHARS:
+        return jsonify({"error": f"At most {PRONOUNCE_BATCH_MAX_CHARS} characters per batch"}), 413
+
+    results = {}  # (normalized text, speed) -> manifest fields, filled once per distinct item
+    phonemes_by_text = {}
+    synthesized = 0
+    for text, speed in requested:
+        if (text, speed) in results:
+            continue
+        if not text:
+            results[text, speed] = {"error": "No text provided"}
+            continue
+        if len(text) > SYNTHESIS_MAX_TEXT_LENGTH:
+            results[text, speed] = {"error": f"Text is longer than {SYNTHESIS_MAX_TEXT_LENGTH} characters"}
+            continue
+        # Each uncached item takes its own synthesis slot, so a large batch queues behind single requests
+        # instead of holding one slot for all of its items
+        needs_slot = not output_cache.contains(output_filename(text, speed))
+        try:
+            with synthesis_scheduler.slot(current_user.id) if needs_slot else contextlib.nullcontext():
+                if text not in phonemes_by_text:
+                    phonemes_by_text[text] = split_normalized_text(text)
+                filename, cached = synthesize_to_cache(text, speed, phonemes_by_text[text], SYNTHESIS_MAX_SECONDS)
+        except SynthesisRejected as e:
+            # Items rendered so far stay cached, so a retry after Retry-After only renders the rest
+            return rejection_response(e)
+        except SynthesisBudgetExceeded as e:
+            results[text, speed] = {"error": str(e)}
+            continue
+        except Exception as e:
+            logger.error(f"Error generating audio for a batch item: {e}")
+            results[text, speed] = {"error": "Failed to generate audio"}
+            continue
+        synthesized += not cached
+        phrase_recorder.record(text, speed)
+        results[text, speed] = {
+            "file": filename,
+            "audio_url": url_for('serve_audio', filename=filename, _external=True),
+            "cached": cached,
+        }
+
+    log_activity(current_user.id, current_user.username, request.remote_addr, "Pronounced batch", droppable=True)
+    def manifest_items():
+        return [{"index": index, "speed": speed, **results[text, speed]} for index, (text, speed) in enumerate(requested)]
+
+    manifest = {
+        "items": manifest_items(),
+        "unique": len(results),
+        "synthesized": synthesized,
+    }
+    if output_format == 'manifest':
+        return jsonify(manifest)
+
+    # Spill to disk past a few megabytes; WAV does not compress, so entries are stored as they are
+    archive = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+        for (text, speed), result in results.items():
+            if "file" not in result:
+                continue
+            try:
+                zf.write(output_cache.path(result["file"]), result["file"])
+                continue
+            except FileNotFoundError:
+                pass
+            # Evicted by a later store in this batch or another worker; write it again, within the same limits,
+            # and leave the item out with an error if that fails
+            try:
+                with synthesis_scheduler.slot(current_user.id):
+                    filename, _ = synthesize_to_cache(text, speed, phonemes_by_text[text], SYNTHESIS_MAX_SECONDS)
+                zf.write(output_cache.path(filename), result["file"])
+            except SynthesisRejected as e:
+                return rejection_response(e)
+            except SynthesisBudgetExceeded as e:
+                results[text, speed] = {"error": str(e)}
+            except Exception as e:
+                logger.error(f"Error generating audio for a batch item: {e}")
+                results[text, speed] = {"error": "Failed to generate audio"}
+        manifest["items"] = manifest_items()
+        zf.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+    archive.seek(0)
+    return send_file(archive, mimetype='application/zip', as_attachment=True, download_name='pronunciations.zip')
+
+# Streaming TTS route: returns the WAV directly, so an <audio> element can start playing after the first segment
+@app.route('/pronounce/stream', methods=['GET', 'POST'])
+@login_required
+def pronounce_stream():
+    text = request.values.get('text')
+    if not text:
+        return jsonify({"error": "No text provided"}), 400
+
+    normalized_text = normalize_text(text)
+    try:
+        speed = parse_speed(request.values.get('speed'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if len(normalized_text) > SYNTHESIS_MAX_TEXT_LENGTH:
+        return jsonify({"error": f"Text is longer than {SYNTHESIS_MAX_TEXT_LENGTH} characters"}), 413
+    # The slot covers planning; the PCM conversion then runs segment by segment as the client reads
+    try:
+        with synthesis_scheduler.slot(current_user.id):
+            phonemes = split_normalized_text(normalized_text)
+            segments, sample_rate = plan_segments(phonemes, speed)
+            if segments:
+                check_duration(segments, sample_rate, SYNTHESIS_MAX_SECONDS)
+    except SynthesisRejected as e:
+        return rejection_response(e)
+    except SynthesisBudgetExceeded as e:
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not segments:
+        return jsonify({"error": "No valid audio files found to process."}), 400
+
+    # Build the header up front: once the response has started, an error can only truncate the stream
+    frames = sum(len(segment) for segment in segments)
+    channels = segments[0].shape[1] if segments[0].ndim > 1 else 1
+    try:
+        header = wav_header(frames, sample_rate, channels)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    log_activity(current_user.id, current_user.username, request.remote_addr, "Streamed text", droppable=True)
+
+    return Response(
+        stream_with_context(stream_wav(header, segments)),
+        mimetype='audio/wav',
+        headers={"Content-Length": str(len(header) + frames * channels * 2), "Cache-Control": "no-store"},
+    )
+
+# Generated files are named by a digest of their text, speed, tokenizer version, phoneme tables and clip bank
+# (see output_filename), so a name keeps its content as long as TOKENIZER_VERSION is bumped with every
+# tokenizer change: the digest serves as a strong ETag and clients may cache the file forever
+GENERATED_AUDIO_NAME = re.compile(r"([0-9a-f]{64})\.wav")
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Function to yield bytes [start, stop) of a file from a memory map, so ranges are sent without reading the rest
+def mapped_file_chunks(filepath, start, stop):
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for position in range(start, stop, AUDIO_CHUNK_SIZE):
+            yield mapped[position:min(position + AUDIO_CHUNK_SIZE, stop)]
+
 # Serve audio files
 @app.route('/audio_files/<filename>')
 def serve_audio(filename):
+    match = GENERATED_AUDIO_NAME.fullmatch(filename)
+    filepath = os.path.join(OUTPUT_DIR, filename)
     try:
-        return send_from_directory(AUDIO_DIR, filename)
-    except FileNotFoundError:
+        length = os.path.getsize(filepath) if match else None
+    except OSError:
+        length = None
+    if not length:
         logger.error(f"Audio file not found: {filename}")
         return jsonify({"error": "Audio file not found"}), 404
 
+    etag = match.group(1)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": AUDIO_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+
+    # A range applies only if the client's copy is this file (If-Range), and only a single range is served
+    start, stop, status = 0, length, 200
+    if request.range is not None and (request.if_range.etag is None or request.if_range.etag == etag):
+        bounds = request.range.range_for_length(length)
+        if bounds is not None:
+            start, stop = bounds
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{stop - 1}/{length}"
+        elif request.range.units == 'bytes' and len(request.range.ranges) == 1:
+            return Response(status=416, headers={**headers, "Content-Range": f"bytes */{length}"})
+    headers["Content-Length"] = str(stop - start)
+
+    if request.method == 'HEAD':
+        return Response(status=status, headers=headers, mimetype='audio/wav')
+    # A download counts as a use, so files clients keep fetching are not the first to be evicted
+    output_cache.touch(filename)
+    return Response(mapped_file_chunks(filepath, start, stop), status=status, headers=headers,
+                    mimetype='audio/wav', direct_passthrough=True)
+
+# Activity logs are listed newest first and paged with a (timestamp, id) cursor, so each page is a short
+# range scan of the timestamp index rather than an OFFSET that grows with the table
+ACTIVITY_LOG_PAGE_SIZE = 50
+ACTIVITY_LOG_MAX_PAGE_SIZE = 500
+ACTIVITY_LOG_EXPORT_BATCH = 1000
+ACTIVITY_LOG_COLUMNS = (ActivityLog.id, ActivityLog.user_id, ActivityLog.username, ActivityLog.ip_address,
+                        ActivityLog.action, ActivityLog.timestamp)
+
+# Function to match ip_address against an address or IPv4 network. Addresses are stored as text, so a
+# network becomes string ranges on whole-octet prefixes ("10.1." <= ip < "10.1/"), which the ip_address index serves.
+# A /25 to /31 has no whole-octet prefix, so its at most 128 addresses are matched exactly.
+def ip_address_filter(value):
+    network = ipaddress.ip_network(value, strict=False)
+    if network.num_addresses == 1:
+        return ActivityLog.ip_address == str(network.network_address)
+    if network.version != 4:
+        raise ValueError("only single IPv6 addresses can be matched")
+    if network.prefixlen == 0:
+        return None
+    octets = -(-network.prefixlen // 8)
+    if octets == 4:
+        return ActivityLog.ip_address.in_([str(address) for address in network])
+    ranges = []
+    for subnet in network.subnets(new_prefix=octets * 8):
+        prefix = '.'.join(str(subnet.network_address).split('.')[:octets])
+        ranges.append(db.and_(ActivityLog.ip_address >= f"{prefix}.", ActivityLog.ip_address < f"{prefix}/"))
+    return db.or_(*ranges)
+
+# Function to build the filtered activity log query from request arguments: username, ip (address or CIDR),
+# since and until (ISO 8601, UTC, until exclusive). Raises ValueError for a malformed filter.
+def activity_log_query(args):
+    query = db.session.query(*ACTIVITY_LOG_COLUMNS)
+    if args.get('username'):
+        query = query.filter(ActivityLog.username == args['username'])
+    if args.get('ip'):
+        ip_filter = ip_address_filter(args['ip'])
+        if ip_filter is not None:
+            query = query.filter(ip_filter)
+    if args.get('since'):
+        query = query.filter(ActivityLog.timestamp >= datetime.fromisoformat(args['since']))
+    if args.get('until'):
+        query = query.filter(ActivityLog.timestamp < datetime.fromisoformat(args['until']))
+    return query
+
+# A cursor names the last row of a page; the next page starts strictly after it
+def encode_log_cursor(row):
+    return f"{row.timestamp.isoformat()}_{row.id}"
+
+def decode_log_cursor(cursor):
+    timestamp, _, row_id = cursor.rpartition('_')
+    return datetime.fromisoformat(timestamp), int(row_id)
+
+# Function to fetch up to limit rows after the cursor, and the cursor of the following page if there is one
+def activity_log_page(query, cursor=None, limit=ACTIVITY_LOG_PAGE_SIZE):
+    if cursor:
+        timestamp, row_id = decode_log_cursor(cursor)
+        # The plain upper bound lets the database start its index scan at the cursor
+        query = query.filter(ActivityLog.timestamp <= timestamp,
+                             db.or_(ActivityLog.timestamp < timestamp, ActivityLog.id < row_id))
+    rows = query.order_by(ActivityLog.timestamp.desc(), ActivityLog.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_log_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+def activity_log_row(row):
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "username": row.username,
+        "ip_address": row.ip_address,
+        "action": row.action,
+        "timestamp": row.timestamp.isoformat(),
+    }
+
+# Raw activity log rows are kept for ACTIVITY_LOG_RETENTION_DAYS. Older rows are counted into
+# ActivityDailyRollup, appended to a gzipped NDJSON file per day and deleted, by `flask prune-activity-logs`.
+ACTIVITY_LOG_RETENTION_DAYS = int(os.getenv('ACTIVITY_LOG_RETENTION_DAYS', '90'))
+ACTIVITY_LOG_ARCHIVE_DIR = os.getenv('ACTIVITY_LOG_ARCHIVE_DIR', os.path.join(os.path.dirname(__file__), 'activity_archive'))
+
+# Function to archive, roll up and delete rows older than cutoff, oldest first, batch_size rows per transaction.
+# A batch is archived before its transaction commits, so a crash in between can only repeat rows in the
+# archive (each carries its id), never lose them; the rollup counts commit together with the delete.
+def prune_activity_logs(cutoff, batch_size, archive_dir, pause=0.0):
+    os.makedirs(archive_dir, exist_ok=True)
+    totals = {"deleted": 0, "batches": 0, "archives": set()}
+    while True:
+        rows = (db.session.query(*ACTIVITY_LOG_COLUMNS)
+                .filter(ActivityLog.timestamp < cutoff)
+                .order_by(ActivityLog.timestamp, ActivityLog.id)
+                .limit(batch_size).all())
+        if not rows:
+            break
+
+        by_day = {}
+        for row in rows:
+            by_day.setdefault(row.timestamp.date(), []).append(row)
+        for day, day_rows in by_day.items():
+            path = os.path.join(archive_dir, f"activity_logs-{day.isoformat()}.ndjson.gz")
+            # Appending adds a gzip member; gzip readers see one continuous file
+            with gzip.open(path, 'at', encoding='utf-8') as f:
+                f.writelines(json.dumps(activity_log_row(row), ensure_ascii=False) + "\n" for row in day_rows)
+                f.flush()
+                os.fsync(f.fileno())
+            totals["archives"].add(path)
+
+        counts = {}
+        for row in rows:
+            key = (row.timestamp.date(), row.user_id, row.action)
+            counts[key] = counts.get(key, 0) + 1
+        usernames = {row.user_id: row.username for row in rows}
+        existing = {
+            (rollup.day, rollup.user_id, rollup.action): rollup
+            for rollup in ActivityDailyRollup.query.filter(ActivityDailyRollup.day.in_(by_day),
+                                                           ActivityDailyRollup.user_id.in_(usernames))
+        }
+        for (day, user_id, action), count in counts.items():
+            rollup = existing.get((day, user_id, action))
+            if rollup is None:
+                db.session.add(ActivityDailyRollup(day=day, user_id=user_id, username=usernames[user_id], action=action, count=count))
+            else:
+                rollup.count += count
+
+        ActivityLog.query.filter(ActivityLog.id.in_([row.id for row in rows])).delete(synchronize_session=False)
+        db.session.commit()
+        totals["deleted"] += len(rows)
+        totals["batches"] += 1
+        # Give request-time writers a turn at the write lock between batches
+        if pause:
+            time.sleep(pause)
+    return totals
+
+@app.cli.command('prune-activity-logs')
+@click.option('--days', default=ACTIVITY_LOG_RETENTION_DAYS, show_default=True, help='Keep raw rows for this many whole days.')
+@click.option('--batch-size', default=1000, show_default=True, help='Rows archived and deleted per transaction.')
+@click.option('--archive-dir', default=ACTIVITY_LOG_ARCHIVE_DIR, show_default=True, help='Where the gzipped NDJSON archives go.')
+@click.option('--pause', default=0.05, show_default=True, help='Seconds to wait between batches.')
+@click.option('--dry-run', is_flag=True, help='Only report how many rows would be removed.')
+def prune_activity_logs_command(days, batch_size, archive_dir, pause, dry_run):
+    """Roll up, archive and delete activity log rows past the retention window; meant for a daily cron."""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    cutoff = today - timedelta(days=days)
+    if dry_run:
+        click.echo(f"{ActivityLog.query.filter(ActivityLog.timestamp < cutoff).count()} rows older than {cutoff.date()}")
+        return
+    totals = prune_activity_logs(cutoff, batch_size, archive_dir, pause)
+    click.echo(f"Removed {totals['deleted']} rows older than {cutoff.date()} in {totals['batches']} batches, "
+               f"archived to {len(totals['archives'])} files in {archive_dir}")
+
 # Activity Logs route
 @app.route('/activity_logs')
 @login_required
@@ -1743,8 +2396,164 @@ def activity_logs():
     if not current_user.is_admin:
         return "Access denied", 403
 
-    logs = ActivityLog.query.order_by(ActivityLog.timestamp.desc()).all()
-    return render_template('activity_logs.html', logs=logs)
+    try:
+        limit = min(max(int(request.args.get('limit', ACTIVITY_LOG_PAGE_SIZE)), 1), ACTIVITY_LOG_MAX_PAGE_SIZE)
+        logs, next_cursor = activity_log_page(activity_log_query(request.args), request.args.get('after'), limit)
+    except ValueError as e:
+        return f"Invalid filter: {e}", 400
+
+    filters = {key: request.args[key] for key in ('username', 'ip', 'since', 'until') if request.args.get(key)}
+    return render_template('activity_logs.html', logs=logs, filters=filters, limit=limit, next_cursor=next_cursor)
+
+# Export of the filtered activity logs as newline-delimited JSON, streamed in keyset batches so memory
+# stays flat however many rows match
+@app.route('/activity_logs/export')
+@login_required
+def export_activity_logs():
+    if not current_user.is_admin:
+        return "Access denied", 403
+
+    try:
+        query = activity_log_query(request.args)
+        cursor = request.args.get('after')
+        if cursor:
+            decode_log_cursor(cursor)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid filter: {e}"}), 400
+
+    def generate(cursor):
+        while True:
+            rows, cursor = activity_log_page(query, cursor, ACTIVITY_LOG_EXPORT_BATCH)
+            if rows:
+                yield "".join(json.dumps(activity_log_row(row), ensure_ascii=False) + "\n" for row in rows)
+            if cursor is None:
+                break
+
+    return Response(
+        stream_with_context(generate(cursor)),
+        mimetype='application/x-ndjson',
+        headers={"Content-Disposition": "attachment; filename=activity_logs.ndjson", "Cache-Control": "no-store"},
+    )
+
+# Per-worker runtime metrics for admins
+@app.route('/metrics')
+@login_required
+def metrics():
+    if not current_user.is_admin:
+        return "Access denied", 403
+
+    return jsonify({
+        "pid": os.getpid(),
+        "memory": process_memory(),
+        "clip_bank": clip_bank.stats(),
+        "output_cache": output_cache.stats(),
+        "number_cache": number_clips.cache_info()._asdict(),
+        "activity_log": activity_log_writer.stats(),
+        "user_cache": user_cache.stats(),
+        "phrases": phrase_recorder.stats(),
+        "cache_warmup": warmup_status,
+        "synthesis": synthesis_scheduler.stats(),
+    })
+
+@app.cli.command('load-test-auth')
+@click.option('--users', default=200, show_default=True, help='Accounts to register and then log in.')
+@click.option('--threads', default=8, show_default=True, help='Concurrent clients.')
+@click.option('--readers', default=2, show_default=True, help='Threads paging through the activity log meanwhile, as admins would.')
+@click.option('--database', 'database_uri', required=True,
+              help='URI of the throwaway database to write to; must repeat DATABASE_URI, which must be set explicitly.')
+def load_test_auth_command(users, threads, readers, database_uri):
+    """Register and log in many users concurrently through the real routes against a throwaway database,
+    then remove them. Compare runs with DATABASE_PROFILE=off to see the engine profile's effect on lock contention."""
+    # The run creates and bulk-deletes users, so it must never fall through to the app's own database
+    if 'DATABASE_URI' not in os.environ:
+        raise click.ClickException("Set DATABASE_URI to a throwaway database; the default is the app's own")
+    if database_uri != app.config['SQLALCHEMY_DATABASE_URI']:
+        raise click.ClickException("--database must repeat DATABASE_URI, to confirm that is the database to write to")
+    if not app.secret_key:
+        raise click.ClickException("Set SECRET_KEY; logging in needs a session")
+    db.create_all()
+    run = f"{random.randrange(16 ** 4):04x}"
+    names = [f"lt{run}-{i}" for i in range(users)]
+    expected = {'register': '/login', 'login': '/app'}
+
+    # Time every statement and count lock errors, since password hashing dominates the request latency
+    statement_times = []
+    lock_errors = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        context._load_test_start = time.perf_counter()
+
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        statement_times.append((time.perf_counter() - context._load_test_start) * 1000)
+
+    def on_error(context):
+        if 'locked' in str(context.original_exception) or 'busy' in str(context.original_exception):
+            lock_errors.append(context.original_exception)
+
+    def attempt(phase, name):
+        client = app.test_client()
+        start = time.perf_counter()
+        response = client.post(f"/{phase}", data={'username': name, 'password': f"{name}-password"})
+        return time.perf_counter() - start, response.status_code == 302 and response.location.endswith(expected[phase])
+
+    stop_readers = threading.Event()
+    pages_read = []
+
+    def read_logs():
+        with app.app_context():
+            while not stop_readers.is_set():
+                cursor = None
+                try:
+                    while not stop_readers.is_set():
+                        rows, cursor = activity_log_page(activity_log_query({}), cursor, ACTIVITY_LOG_PAGE_SIZE)
+                        pages_read.append(len(rows))
+                        if cursor is None:
+                            break
+                except Exception:
+                    db.session.rollback()
+                time.sleep(0.01)
+
+    def percentile(values, share):
+        return sorted(values)[min(len(values) - 1, int(len(values) * share))] if values else 0.0
+
+    click.echo(f"Profile {database_profile(app.config['SQLALCHEMY_DATABASE_URI'])}, {users} users, {threads} threads, {readers} readers")
+    db.event.listen(db.engine, 'before_cursor_execute', before_execute)
+    db.event.listen(db.engine, 'after_cursor_execute', after_execute)
+    db.event.listen(db.engine, 'handle_error', on_error)
+    reader_threads = [threading.Thread(target=read_logs, daemon=True) for _ in range(readers)]
+    for thread in reader_threads:
+        thread.start()
+    try:
+        for phase in ('register', 'login'):
+            statement_times.clear()
+            start = time.perf_counter()
+            with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+                outcomes = list(pool.map(lambda name: attempt(phase, name), names))
+            elapsed = time.perf_counter() - start
+            latencies = [latency * 1000 for latency, _ in outcomes]
+            failed = sum(1 for _, ok in outcomes if not ok)
+            click.echo(f"{phase:9} {users / elapsed:6.1f}/s  request p50 {percentile(latencies, 0.5):7.1f} ms  "
+                       f"p95 {percentile(latencies, 0.95):7.1f} ms  {failed} failed  |  statements p50 "
+                       f"{percentile(statement_times, 0.5):6.2f} ms  p99 {percentile(statement_times, 0.99):7.2f} ms  "
+                       f"max {max(statement_times, default=0.0):7.1f} ms")
+        activity_log_writer.close()
+        click.echo(f"activity log: {activity_log_writer.written} rows written, {activity_log_writer.failed} failed; "
+                   f"{len(pages_read)} log pages read; {len(lock_errors)} lock errors")
+    finally:
+        stop_readers.set()
+        for thread in reader_threads:
+            thread.join()
+        # Write out queued log rows before their users are deleted, or they would be written afterwards
+        # pointing at users that no longer exist
+        activity_log_writer.close()
+        db.event.remove(db.engine, 'before_cursor_execute', before_execute)
+        db.event.remove(db.engine, 'after_cursor_execute', after_execute)
+        db.event.remove(db.engine, 'handle_error', on_error)
+        user_ids = [user.id for user in User.query.filter(User.username.like(f"lt{run}-%"))]
+        for start in range(0, len(user_ids), 500):
+            ActivityLog.query.filter(ActivityLog.user_id.in_(user_ids[start:start + 500])).delete(synchronize_session=False)
+            User.query.filter(User.id.in_(user_ids[start:start + 500])).delete(synchronize_session=False)
+        db.session.commit()
 
 if __name__ == '__main__':
     with app.app_context():
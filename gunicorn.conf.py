@@ -0,0 +1,33 @@
+# Gunicorn settings for the Procfile. Worker count comes from WEB_CONCURRENCY and the port from PORT,
+# which gunicorn reads on its own.
+import os
+
+# Import the app once in the master, so the clip bank and phoneme tables are decoded a single time
+# and every worker shares those pages copy-on-write instead of building its own copy
+preload_app = True
+
+# Threaded workers, so cache hits and audio downloads are served while a synthesis runs.
+# The app's synthesis scheduler (SYNTHESIS_CONCURRENCY, SYNTHESIS_QUEUE_SIZE) bounds the CPU-bound work per worker.
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+def when_ready(server):
+    from app import preload_for_fork
+    preload_for_fork()
+
+def post_fork(server, worker):
+    # Database connections must not cross a fork; forget any the master opened so each worker makes its own.
+    # close=False leaves the inherited sockets alone: closing them would end the master's sessions for every process.
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+    # Pre-render the most requested phrases if CACHE_WARMUP_ON_START is set; one worker does it, the rest skip
+    from app import start_cache_warmup
+    start_cache_warmup()
+
+def worker_exit(server, worker):
+    # Write out activity log rows and phrase counts still queued in this worker
+    from app import activity_log_writer, phrase_recorder
+    activity_log_writer.close()
+    phrase_recorder.close()
@@ -0,0 +1,63 @@
+"""initial schema
+
+Revision ID: 829fb1c651e1
+Revises: 
+Create Date: 2026-10-18 15:49:48.403001
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '829fb1c651e1'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases made before migrations existed already have these tables from db.create_all()
+    existing = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'user' not in existing:
+        op.create_table('user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=20), nullable=False),
+        sa.Column('password', sa.String(length=60), nullable=False),
+        sa.Column('is_admin', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('user', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_user_username'), ['username'], unique=True)
+
+    if 'activity_log' not in existing:
+        op.create_table('activity_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=20), nullable=False),
+        sa.Column('ip_address', sa.String(length=15), nullable=False),
+        sa.Column('action', sa.String(length=100), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('activity_log', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_activity_log_ip_address'), ['ip_address'], unique=False)
+            batch_op.create_index(batch_op.f('ix_activity_log_timestamp'), ['timestamp'], unique=False)
+            batch_op.create_index(batch_op.f('ix_activity_log_user_id'), ['user_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_activity_log_username'), ['username'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('activity_log', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_activity_log_username'))
+        batch_op.drop_index(batch_op.f('ix_activity_log_user_id'))
+        batch_op.drop_index(batch_op.f('ix_activity_log_timestamp'))
+        batch_op.drop_index(batch_op.f('ix_activity_log_ip_address'))
+
+    op.drop_table('activity_log')
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_username'))
+
+    op.drop_table('user')
@@ -0,0 +1,42 @@
+"""add phrase frequency
+
+Revision ID: 82b335881ba1
+Revises: 85eedd4296d3
+Create Date: 2026-10-18 15:49:49.819279
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '82b335881ba1'
+down_revision = '85eedd4296d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Skipped if db.create_all() (python app.py) already made the table
+    if sa.inspect(op.get_bind()).has_table('phrase_frequency'):
+        return
+
+    op.create_table('phrase_frequency',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('digest', sa.String(length=64), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('speed', sa.Float(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('last_requested', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('digest')
+    )
+    with op.batch_alter_table('phrase_frequency', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_phrase_frequency_last_requested'), ['last_requested'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('phrase_frequency', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_phrase_frequency_last_requested'))
+
+    op.drop_table('phrase_frequency')
@@ -0,0 +1,43 @@
+"""add activity daily rollup
+
+Revision ID: 85eedd4296d3
+Revises: 829fb1c651e1
+Create Date: 2026-10-18 15:49:49.117973
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '85eedd4296d3'
+down_revision = '829fb1c651e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Skipped if db.create_all() (python app.py) already made the table
+    if sa.inspect(op.get_bind()).has_table('activity_daily_rollup'):
+        return
+
+    op.create_table('activity_daily_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=20), nullable=False),
+    sa.Column('action', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'user_id', 'action')
+    )
+    with op.batch_alter_table('activity_daily_rollup', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_activity_daily_rollup_day'), ['day'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('activity_daily_rollup', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_activity_daily_rollup_day'))
+
+    op.drop_table('activity_daily_rollup')